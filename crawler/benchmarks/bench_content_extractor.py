@@ -0,0 +1,89 @@
+"""
+正文提取基准测试
+在 benchmarks/fixtures 下的文章页面上对比选择器级联（默认）和单次遍历提取器，
+并按各分组的 expected_content.json 校验提取结果，校验失败时以非零状态退出；
+保存的真实页面（saved）和生成的合成页面（synthetic）分别报告
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.bench_content_extractor [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Dict, Optional
+
+from benchmarks.fixture_loader import available_groups, load_expectations, load_pages
+from utils.content_extractor import extract_by_selectors, extract_main_content
+from utils.html_parser import make_soup
+
+def time_extract(html: str, extract, repeat: int) -> float:
+    """返回单次提取的平均耗时（毫秒），不含建树时间"""
+    soups = [make_soup(html) for _ in range(repeat)]
+    start = time.perf_counter()
+    for soup in soups:
+        extract(soup)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def check(name: str, content: Optional[str], expected: Dict[str, Any]) -> list:
+    """按预期校验提取结果，返回错误列表"""
+    if content is None:
+        return [f"{name}: no content extracted"]
+    errors = []
+    paragraphs = content.count('\n\n') + 1
+    if paragraphs != expected['paragraphs']:
+        errors.append(f"{name}: expected {expected['paragraphs']} paragraphs, got {paragraphs}")
+    if not content.startswith(expected['starts_with']):
+        errors.append(f"{name}: unexpected start {content[:60]!r}")
+    if not content.endswith(expected['ends_with']):
+        errors.append(f"{name}: unexpected end {content[-60:]!r}")
+    for excluded in expected.get('excludes', []):
+        if excluded in content:
+            errors.append(f"{name}: boilerplate {excluded!r} leaked into content")
+    return errors
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=20, help='每个页面重复提取次数')
+    args = arg_parser.parse_args()
+
+    groups = available_groups()
+    if 'saved' not in groups:
+        print("No saved pages under benchmarks/fixtures/saved; results below reflect synthetic markup only\n")
+
+    errors = []
+    checked = 0
+    for group in groups:
+        pages = load_pages(group)
+        expectations = load_expectations(group)
+        selectors_total = new_total = 0.0
+        print(f"[{group}]")
+        print(f"{'fixture':<32}{'selectors':>12}{'single-pass':>14}{'speedup':>9}")
+        for name, expected in sorted(expectations.items()):
+            html = pages[name]
+            content = extract_main_content(make_soup(html))
+            # 结果必须是确定性的
+            if extract_main_content(make_soup(html)) != content:
+                errors.append(f"{group}/{name}: extraction is not deterministic")
+            errors.extend(check(f"{group}/{name}", content, expected))
+
+            selectors = time_extract(html, extract_by_selectors, args.repeat)
+            new = time_extract(html, extract_main_content, args.repeat)
+            selectors_total += selectors
+            new_total += new
+            print(f"{name:<32}{selectors:>9.2f} ms{new:>11.2f} ms{selectors / new:>8.1f}x")
+
+        if expectations:
+            print(f"{'total':<32}{selectors_total:>9.2f} ms{new_total:>11.2f} ms{selectors_total / new_total:>8.1f}x")
+        print()
+        checked += len(expectations)
+
+    if errors:
+        print('\n'.join(errors), file=sys.stderr)
+        sys.exit(1)
+    print(f"All {checked} fixtures extracted as expected")
+
+if __name__ == '__main__':
+    main()
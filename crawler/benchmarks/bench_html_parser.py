@@ -0,0 +1,72 @@
+"""
+HTML解析后端基准测试
+对 benchmarks/fixtures 下的页面分别用各解析器建树，输出每页平均耗时；
+保存的真实页面（saved）和生成的合成页面（synthetic）分别报告
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.bench_html_parser [--repeat N]
+"""
+
+import argparse
+import time
+from typing import List
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from benchmarks.fixture_loader import available_groups, load_pages
+from utils.html_parser import PARSER_BACKEND, make_soup
+
+CANDIDATE_PARSERS = ['html.parser', 'lxml', 'html5lib']
+
+
+def available_parsers() -> List[str]:
+    parsers = []
+    for parser in CANDIDATE_PARSERS:
+        try:
+            BeautifulSoup('<p></p>', parser)
+            parsers.append(parser)
+        except FeatureNotFound:
+            pass
+    return parsers
+
+
+def time_parse(html: str, parser: str, repeat: int) -> float:
+    """返回单次建树的平均耗时（毫秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        make_soup(html, parser=parser)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--repeat', type=int, default=20, help='每个页面重复解析次数')
+    args = arg_parser.parse_args()
+
+    parsers = available_parsers()
+    groups = available_groups()
+    print(f"Configured backend: {PARSER_BACKEND}")
+    if 'saved' not in groups:
+        print("No saved pages under benchmarks/fixtures/saved; results below reflect synthetic markup only")
+
+    for group in groups:
+        print(f"\n[{group}]")
+        print(f"{'fixture':<32}{'KiB':>7}" + ''.join(f"{p:>14}" for p in parsers))
+        totals = {parser: 0.0 for parser in parsers}
+        for name, html in load_pages(group).items():
+            row = f"{name:<32}{len(html.encode('utf-8')) / 1024:>7.0f}"
+            for parser in parsers:
+                elapsed = time_parse(html, parser, args.repeat)
+                totals[parser] += elapsed
+                row += f"{elapsed:>11.2f} ms"
+            print(row)
+
+        print(f"{'total':<39}" + ''.join(f"{totals[p]:>11.2f} ms" for p in parsers))
+        baseline = totals.get('html.parser')
+        if baseline:
+            for parser in parsers:
+                if parser != 'html.parser':
+                    print(f"{parser}: {baseline / totals[parser]:.2f}x faster than html.parser")
+
+if __name__ == '__main__':
+    main()
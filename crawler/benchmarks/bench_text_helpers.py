@@ -0,0 +1,97 @@
+"""
+文本工具函数微基准测试
+对比 clean_text 和 parse_date 的旧实现（每次调用时编译/查找正则、逐个尝试日期格式）与当前实现
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.bench_text_helpers [--number N] [--repeat N]
+"""
+
+import argparse
+import re
+import timeit
+from datetime import datetime, timezone
+
+from loguru import logger
+
+from utils.helpers import clean_text, parse_date
+
+
+def legacy_clean_text(text: str) -> str:
+    """旧版 clean_text"""
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def legacy_parse_date(date_str: str):
+    """旧版 parse_date（不含失败时的日志和当前时间回退）"""
+    if not date_str:
+        return None
+    date_patterns = [
+        r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})',
+        r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2})',
+        r'(\d{4})-(\d{1,2})-(\d{1,2})',
+        r'(\d{4})年(\d{1,2})月(\d{1,2})日',
+        r'(\d{1,2})月(\d{1,2})日',
+    ]
+    for pattern in date_patterns:
+        match = re.search(pattern, date_str)
+        if match:
+            try:
+                groups = match.groups()
+                if len(groups) >= 3:
+                    year = int(groups[0]) if len(groups[0]) == 4 else datetime.now().year
+                    month = int(groups[1] if len(groups) > 2 else groups[0])
+                    day = int(groups[2] if len(groups) > 2 else groups[1])
+                    hour = int(groups[3]) if len(groups) > 3 else 0
+                    minute = int(groups[4]) if len(groups) > 4 else 0
+                    second = int(groups[5]) if len(groups) > 5 else 0
+                    return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc).isoformat()
+            except (ValueError, IndexError):
+                continue
+    return datetime.now(timezone.utc).isoformat()
+
+
+CLEAN_TEXT_SAMPLES = {
+    'plain title': '  TSMC Ramps 2nm   Production as\n Chiplet Demand Grows  ',
+    'plain paragraph': ('Foundry capacity for advanced packaging remains tight.\n\t ' * 20),
+    'html snippet': '<p>Synopsys <b>announces</b> new <a href="/eda">EDA</a> flow</p>\n  <br/>for 3nm',
+}
+DATE_SAMPLES = {
+    'date only': '2024-03-12',
+    'chinese date': '发布于 2024年3月12日',
+    'date with minutes': 'Updated 2024-03-12 08:30',
+}
+
+
+def bench(func, arg, number: int, repeat: int) -> float:
+    """返回单次调用的平均耗时（微秒），取多轮中最快的一轮以减少机器负载波动的影响"""
+    return min(timeit.repeat(lambda: func(arg), number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--number', type=int, default=20000, help='每轮每个样本的调用次数')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='每个样本的测量轮数')
+    args = arg_parser.parse_args()
+    logger.remove()
+
+    print(f"{'clean_text':<24}{'legacy':>12}{'current':>12}{'speedup':>9}")
+    for name, sample in CLEAN_TEXT_SAMPLES.items():
+        assert clean_text(sample) == legacy_clean_text(sample), name
+        legacy = bench(legacy_clean_text, sample, args.number, args.repeat)
+        current = bench(clean_text, sample, args.number, args.repeat)
+        print(f"{name:<24}{legacy:>9.2f} us{current:>9.2f} us{legacy / current:>8.1f}x")
+
+    print(f"\n{'parse_date':<24}{'legacy':>12}{'current':>12}{'speedup':>9}")
+    for name, sample in DATE_SAMPLES.items():
+        assert parse_date(sample, 'benchmark-' + name) == legacy_parse_date(sample), name
+        legacy = bench(legacy_parse_date, sample, args.number, args.repeat)
+        current = bench(lambda s: parse_date(s, 'benchmark-' + name), sample, args.number, args.repeat)
+        print(f"{name:<24}{legacy:>9.2f} us{current:>9.2f} us{legacy / current:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+标题近似重复判定检查
+两个方向都要检查：同一新闻改写或转载后的标题应判为重复，
+公司、金额、月份、季度不同的新闻标题不能判为重复。
+有判定错误时以非零状态退出
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.check_near_dup
+"""
+
+import sys
+
+from utils.dedup import NearDuplicateTitleIndex
+
+# 同一新闻的不同写法，应判为重复
+DUPLICATE_PAIRS = [
+    ("TSMC Reports October 2024 Revenue", "TSMC reports October 2024 revenue"),
+    ("TSMC Reports October 2024 Revenue", "TSMC Reports October 2024 Revenue - EE Times"),
+    ("Nvidia unveils Blackwell GPU at GTC", "NVIDIA Unveils Blackwell GPU at GTC 2024"),
+    ("Samsung to invest $44 billion in Texas fab", "Samsung to invest $44 billion in Texas fabs"),
+    ("Synopsys completes acquisition of Ansys", "Synopsys Completes Acquisition of Ansys"),
+    ("Synopsys completes acquisition of Ansys", "Synopsys completes its acquisition of Ansys"),
+    ("Intel Reports Second-Quarter 2024 Financial Results", "Intel reports second-quarter 2024 financial results | SemiWiki"),
+    ("台积电宣布在美国亚利桑那州新建晶圆厂", "台积电宣布在美国亚利桑那州新建晶圆厂！"),
+]
+
+# 不同的新闻，不能判为重复
+DISTINCT_PAIRS = [
+    ("TSMC Reports October 2024 Revenue", "UMC Reports October 2024 Revenue"),
+    ("TSMC Reports October 2024 Revenue", "TSMC Reports September 2024 Revenue"),
+    ("TSMC Reports October 2024 Revenue", "TSMC Reports October 2023 Revenue"),
+    ("Samsung to invest $17 billion in Texas fab", "Samsung to invest $44 billion in Texas fab"),
+    ("Intel Reports First-Quarter 2024 Financial Results", "Intel Reports Second-Quarter 2024 Financial Results"),
+    ("AMD Reports Q2 2024 Results", "AMD Reports Q3 2024 Results"),
+    ("中芯国际发布2024年第一季度财报", "中芯国际发布2024年第二季度财报"),
+    ("中芯国际发布2024年第二季度财报", "中芯国际发布2023年第二季度财报"),
+]
+
+
+def main() -> int:
+    failures = []
+    for expected, pairs in ((True, DUPLICATE_PAIRS), (False, DISTINCT_PAIRS)):
+        for existing, title in pairs:
+            index = NearDuplicateTitleIndex()
+            index.add(existing)
+            if index.is_duplicate(title) != expected:
+                failures.append((expected, existing, title))
+
+    index = NearDuplicateTitleIndex()
+    # 相似度恰好等于阈值的标题对进入同一个桶（被比较）的概率
+    candidate_rate = 1 - (1 - index.threshold ** index.rows) ** index.bands
+    print(f"threshold={index.threshold} bands={index.bands} rows={index.rows} "
+          f"candidate rate at threshold={candidate_rate:.0%}")
+
+    for expected, existing, title in failures:
+        kind = 'missed duplicate' if expected else 'false duplicate'
+        print(f"FAIL {kind}: {existing!r} / {title!r}")
+    total = len(DUPLICATE_PAIRS) + len(DISTINCT_PAIRS)
+    print(f"{total - len(failures)}/{total} pairs judged correctly")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+启动耗时检查
+在新的解释器中导入 main，检查导入耗时是否在预算内，
+并确认较重的依赖（数据库客户端、分词、HTTP和HTML解析库）没有在导入时加载。
+超出预算或加载了不该加载的模块时以非零状态退出
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.check_startup [--budget 0.3] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# 只应在执行具体命令时才导入的模块
+DEFERRED_MODULES = ['supabase', 'jieba', 'aiohttp', 'bs4', 'requests', 'openai', 'schedule', 'scrapers.news_scraper']
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def measure(crawler_dir: str) -> dict:
+    env = dict(os.environ)
+    # 导入阶段不应读取这些配置，给出占位值以免缺少配置影响测量
+    env.setdefault('SUPABASE_URL', 'http://localhost')
+    env.setdefault('SUPABASE_SERVICE_ROLE_KEY', 'placeholder')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=crawler_dir, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument('--budget', type=float, default=0.3, help='import main 的耗时预算（秒）')
+    arg_parser.add_argument('--runs', type=int, default=3, help='测量次数，取最小值')
+    args = arg_parser.parse_args()
+
+    crawler_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = [measure(crawler_dir) for _ in range(args.runs)]
+    elapsed = min(result['elapsed'] for result in results)
+    loaded = sorted({module for result in results for module in result['loaded']})
+
+    print(f"import main: {elapsed * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+    failed = False
+    if elapsed > args.budget:
+        print("FAIL: import time exceeds budget", file=sys.stderr)
+        failed = True
+    if loaded:
+        print(f"FAIL: deferred modules loaded at import: {', '.join(loaded)}", file=sys.stderr)
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
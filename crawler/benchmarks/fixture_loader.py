@@ -0,0 +1,44 @@
+"""
+基准测试页面加载
+fixtures/saved      保存的真实页面（原样保存的HTML）
+fixtures/synthetic  benchmarks/generate_fixtures.py 生成的合成页面（结构仿照真实站点，正文为随机文本）
+
+两组页面分开加载和报告，合成页面上的结果不能代表真实页面
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+FIXTURE_GROUPS = ['saved', 'synthetic']
+
+
+def available_groups() -> List[str]:
+    """返回存在HTML页面的分组"""
+    groups = []
+    for group in FIXTURE_GROUPS:
+        directory = os.path.join(FIXTURES_DIR, group)
+        if os.path.isdir(directory) and any(name.endswith('.html') for name in os.listdir(directory)):
+            groups.append(group)
+    return groups
+
+
+def load_pages(group: str) -> Dict[str, str]:
+    """加载分组中的所有页面，返回 {文件名: HTML}"""
+    directory = os.path.join(FIXTURES_DIR, group)
+    pages = {}
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.html'):
+            with open(os.path.join(directory, name), encoding='utf-8') as f:
+                pages[name] = f.read()
+    return pages
+
+
+def load_expectations(group: str) -> Dict[str, Dict[str, Any]]:
+    """加载分组的正文提取预期（expected_content.json），没有时返回空字典"""
+    path = os.path.join(FIXTURES_DIR, group, 'expected_content.json')
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,141 @@
+"""
+合成测试页面生成器
+生成 benchmarks/fixtures/synthetic 下的页面：页面结构仿照 EETimes、ElectronicDesign、SemiWiki
+文章页和列表页以及IC技术圈成员页（导航、侧边栏、评论、相关文章、大量脚本和样式），
+正文是由行业词汇随机拼成的句子。这些页面不是保存的真实页面，只用于可复现的基准测试；
+真实页面放在 benchmarks/fixtures/saved 下。
+
+固定随机种子，重复运行生成完全相同的文件
+
+用法（在 crawler 目录下）:
+    python -m benchmarks.generate_fixtures
+"""
+
+import os
+import random
+
+from benchmarks.fixture_loader import FIXTURES_DIR
+
+OUTPUT_DIR = os.path.join(FIXTURES_DIR, 'synthetic')
+
+WORDS = ("semiconductor wafer foundry node lithography EUV yield packaging chiplet interposer "
+         "design verification tapeout EDA synthesis timing power memory DRAM NAND controller "
+         "analog mixed-signal RF PLL SerDes PCIe UCIe HBM substrate capacity fab process "
+         "transistor gate-all-around FinFET 3nm 2nm customer revenue quarter demand supply").split()
+
+
+def sent(n=None):
+    n = n or random.randint(12, 28)
+    w = [random.choice(WORDS) for _ in range(n)]
+    return (" ".join(w)).capitalize() + "."
+
+
+def para(k=None):
+    return " ".join(sent() for _ in range(k or random.randint(3, 6)))
+
+
+def nav(prefix):
+    items = "".join(
+        f'<li class="menu-item menu-item-{i}"><a href="/{prefix}/{i}">{random.choice(WORDS).title()} '
+        f'{random.choice(WORDS).title()}</a><ul class="sub-menu">'
+        + "".join(f'<li><a href="/{prefix}/{i}/{j}">{random.choice(WORDS)}</a></li>' for j in range(8))
+        + '</ul></li>'
+        for i in range(24))
+    return f'<nav class="main-nav" role="navigation"><ul class="menu">{items}</ul></nav>'
+
+
+def scripts(n):
+    return "".join(
+        f'<script type="text/javascript">window.dataLayer=window.dataLayer||[];function gtag{i}(){{dataLayer.push(arguments)}};'
+        f'var cfg{i}={{"id":"UA-{i}","pages":[{",".join(str(random.randint(1, 9999)) for _ in range(60))}]}};</script>'
+        for i in range(n))
+
+
+def sidebar():
+    return ('<aside class="sidebar widget-area">'
+            + "".join(f'<section class="widget"><h3 class="widget-title">{sent(3)}</h3><ul>'
+                      + "".join(f'<li><a href="/post/{random.randint(1, 99999)}">{sent(8)}</a></li>' for _ in range(10))
+                      + '</ul></section>' for _ in range(6))
+            + '<div class="advertisement ads"><img src="/ad.png" alt="ad"></div></aside>')
+
+
+def footer():
+    return ('<footer class="site-footer"><div class="footer-links">'
+            + "".join(f'<a href="/f/{i}">{random.choice(WORDS)}</a> | ' for i in range(80))
+            + '</div><p class="copyright">Copyright 2024. All rights reserved.</p></footer>')
+
+
+def head(title):
+    return (f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title>'
+            + "".join(f'<meta name="m{i}" content="{sent(6)}">' for i in range(20))
+            + '<style>' + "".join(f'.c{i}{{margin:{i}px;padding:{i % 7}px;color:#{i:06x}}}' for i in range(400)) + '</style>'
+            + scripts(6) + '</head>')
+
+
+def article_page(title, body_class, wrapper):
+    paras = "".join(
+        f"<p>{para()}</p>"
+        + (f'<h2>{sent(6)}</h2>' if i % 4 == 3 else "")
+        + (f'<figure><img src="/img/{i}.png"><figcaption>{sent(8)}</figcaption></figure>' if i % 5 == 2 else "")
+        for i in range(14))
+    comments = ('<section id="comments" class="comments-area">'
+                + "".join(f'<div class="comment"><span class="comment-author">user{i}</span><p>{sent(10)}</p></div>'
+                          for i in range(25))
+                + '</section>')
+    related = ('<div class="related-posts post-list">'
+               + "".join(f'<div class="post-item"><a href="/r/{i}">{sent(9)}</a><p class="post-excerpt">{sent(15)}</p></div>'
+                         for i in range(12))
+               + '</div>')
+    return (head(title)
+            + f'<body class="{body_class}"><header class="site-header"><div class="logo"><a href="/">Site</a></div>{nav("c")}</header>'
+            + '<div class="site-content"><div class="content-wrapper">' + wrapper.format(title=title, date="Mar 12, 2024", body=paras)
+            + related + comments + '</div>' + sidebar() + '</div>' + footer() + scripts(10) + '</body></html>')
+
+
+def generate_pages():
+    random.seed(7)
+    pages = {
+        'article_eetimes.html': article_page(
+            "TSMC Ramps 2nm Production as Chiplet Demand Grows", "single single-post",
+            '<main id="main"><article class="post type-post"><h1 class="entry-title">{title}</h1>'
+            '<div class="entry-meta"><span class="entry-date">{date}</span> by <span class="author">Staff</span></div>'
+            '<div class="entry-content">{body}</div><div class="share-buttons">Share: Twitter LinkedIn Facebook</div></article></main>'),
+        'article_electronicdesign.html': article_page(
+            "Designing PCIe 6.0 SerDes for Low Power Data Center Links", "page-article",
+            '<div class="page-wrapper"><div class="article-header"><h1>{title}</h1><time>{date}</time></div>'
+            '<div class="article-body"><div class="html">{body}</div></div>'
+            '<div class="newsletter-signup"><p>Sign up for our newsletter to receive the latest electronics news.</p>'
+            '<input type="email"></div></div>'),
+        'article_semiwiki.html': article_page(
+            "UCIe Verification Challenges for Multi-Die Systems", "forum-thread",
+            '<div class="block"><div class="message-inner"><h1 class="p-title-value">{title}</h1>'
+            '<div class="message-attribution">{date}</div><div class="message-content"><div class="bbWrapper">{body}</div></div></div></div>'),
+    }
+    listing_items = "".join(
+        f'<div class="post-item"><h2 class="post-title"><a href="https://www.semiwiki.com/semiconductor/{i}-post/">{sent(9)}</a></h2>'
+        f'<div class="post-excerpt">{sent(25)}</div><span class="post-date">2024-03-{(i % 28) + 1:02d}</span>'
+        f'<div class="post-tags">' + "".join(f'<a href="/tag/{random.choice(WORDS)}">{random.choice(WORDS)}</a>' for _ in range(5))
+        + '</div></div>'
+        for i in range(40))
+    pages['listing_semiwiki.html'] = (
+        head("SemiWiki") + f'<body class="home"><header class="site-header">{nav("l")}</header>'
+        f'<div class="site-content"><main class="posts">{listing_items}</main>{sidebar()}</div>{footer()}{scripts(10)}</body></html>')
+    members = "".join(
+        f'<div class="member-card"><img class="avatar" src="/a/{i}.png"><h3 class="name">IC公众号{i}</h3>'
+        f'<p class="description">专注于芯片设计与验证技术分享，{sent(10)}</p><span class="wechat-id">ic_tech_{i}</span></div>'
+        for i in range(120))
+    pages['iccircle_members.html'] = (
+        head("IC技术圈成员") + f'<body><header>{nav("m")}</header><div class="member-list">{members}</div>{footer()}</body></html>')
+    return pages
+
+
+def main():
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    for name, html in generate_pages().items():
+        with open(os.path.join(OUTPUT_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"{name}: {len(html)} bytes")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,13 @@ load_dotenv()
 # Supabase配置
 SUPABASE_URL = os.getenv('SUPABASE_URL')
 SUPABASE_SERVICE_ROLE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+# 分页查询每页行数（PostgREST默认单次最多返回1000行）
+DB_PAGE_SIZE = int(os.getenv('DB_PAGE_SIZE', '1000'))
+# 批量删除时每次请求的最大ID数量（受URL长度限制）
+DB_DELETE_BATCH_SIZE = int(os.getenv('DB_DELETE_BATCH_SIZE', '100'))
+# 新闻批量写入：每批最多行数、最长等待时间（秒）
+NEWS_WRITE_BATCH_SIZE = int(os.getenv('NEWS_WRITE_BATCH_SIZE', '50'))
+NEWS_WRITE_FLUSH_INTERVAL = float(os.getenv('NEWS_WRITE_FLUSH_INTERVAL', '5'))
 
 # 爬虫配置
 USER_AGENT = os.getenv('USER_AGENT', 'IC123-Crawler/1.0')
@@ -13,10 +20,49 @@ CRAWL_DELAY = int(os.getenv('CRAWL_DELAY', '1'))
 CONCURRENT_REQUESTS = int(os.getenv('CONCURRENT_REQUESTS', '2'))
 DOWNLOAD_TIMEOUT = int(os.getenv('DOWNLOAD_TIMEOUT', '30'))
 
+# 连接池配置
+HTTP_POOL_LIMIT = int(os.getenv('HTTP_POOL_LIMIT', '100'))
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv('HTTP_POOL_LIMIT_PER_HOST', '4'))
+DNS_CACHE_TTL = int(os.getenv('DNS_CACHE_TTL', '300'))
+HTTP_KEEPALIVE_TIMEOUT = int(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+
+# 文章正文抓取配置
+ARTICLE_FETCH_CONCURRENCY = int(os.getenv('ARTICLE_FETCH_CONCURRENCY', '4'))
+ARTICLE_FETCH_TIMEOUT = int(os.getenv('ARTICLE_FETCH_TIMEOUT', '20'))
+
+# 新闻处理流水线（抓取→解析→过滤→翻译→保存）配置
+# 阶段之间队列的最大长度，下游处理不过来时上游暂停
+PIPELINE_QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '20'))
+# 各阶段的worker数量（正文抓取阶段使用 ARTICLE_FETCH_CONCURRENCY）
+PIPELINE_PARSE_WORKERS = int(os.getenv('PIPELINE_PARSE_WORKERS', '1'))
+PIPELINE_FILTER_WORKERS = int(os.getenv('PIPELINE_FILTER_WORKERS', '1'))
+PIPELINE_TRANSLATE_WORKERS = int(os.getenv('PIPELINE_TRANSLATE_WORKERS', '16'))
+# 保存阶段只把新闻交给批量写入器，不等待写入完成
+PIPELINE_SAVE_WORKERS = int(os.getenv('PIPELINE_SAVE_WORKERS', '1'))
+
+# HTML解析器（lxml 未安装时自动回退到 html.parser）
+HTML_PARSER = os.getenv('HTML_PARSER', 'lxml')
+
+# 文章正文提取方式：selectors（选择器级联）/ density（单次遍历按文本密度定位，尚未在真实页面上验证）
+CONTENT_EXTRACTOR = os.getenv('CONTENT_EXTRACTOR', 'selectors')
+
 # 代理配置
 HTTP_PROXY = os.getenv('HTTP_PROXY')
 HTTPS_PROXY = os.getenv('HTTPS_PROXY')
 
+# 本地状态数据目录（缓存、增量爬取状态等）
+CRAWLER_DATA_DIR = os.getenv('CRAWLER_DATA_DIR', 'data')
+
+# 翻译缓存配置
+TRANSLATION_CACHE_PATH = os.getenv('TRANSLATION_CACHE_PATH', os.path.join(CRAWLER_DATA_DIR, 'translation_cache.db'))
+TRANSLATION_CACHE_MAX_ENTRIES = int(os.getenv('TRANSLATION_CACHE_MAX_ENTRIES', '50000'))
+
+# 条件请求配置（保存各新闻源的 ETag / Last-Modified）
+HTTP_VALIDATORS_PATH = os.getenv('HTTP_VALIDATORS_PATH', os.path.join(CRAWLER_DATA_DIR, 'http_validators.json'))
+
+# 增量爬取配置（保存各新闻源已处理的最新发布时间和GUID）
+SOURCE_WATERMARKS_PATH = os.getenv('SOURCE_WATERMARKS_PATH', os.path.join(CRAWLER_DATA_DIR, 'source_watermarks.json'))
+
 # 日志配置
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FILE = os.getenv('LOG_FILE', 'crawler.log')
@@ -24,6 +70,10 @@ LOG_FILE = os.getenv('LOG_FILE', 'crawler.log')
 # 调度配置
 SCHEDULE_NEWS_HOURS = [int(h) for h in os.getenv('SCHEDULE_NEWS_HOURS', '6,12,18').split(',')]
 SCHEDULE_WEBSITES_DAYS = int(os.getenv('SCHEDULE_WEBSITES_DAYS', '7'))
+# 调度器状态（各任务上次运行时间和结果）保存路径，重启后据此补跑错过的任务
+SCHEDULER_STATE_PATH = os.getenv('SCHEDULER_STATE_PATH', os.path.join(CRAWLER_DATA_DIR, 'scheduler_state.json'))
+# 启动时多个补跑任务之间的间隔（秒）
+SCHEDULER_CATCHUP_INTERVAL = int(os.getenv('SCHEDULER_CATCHUP_INTERVAL', '300'))
 
 # 新闻源配置
 NEWS_SOURCES = [
@@ -64,8 +114,36 @@ NEWS_SOURCES = [
 
 # 网站验证配置
 WEBSITE_CHECK_TIMEOUT = 10
+WEBSITE_CHECK_CONCURRENCY = int(os.getenv('WEBSITE_CHECK_CONCURRENCY', '10'))
+WEBSITE_CHECK_PER_HOST = int(os.getenv('WEBSITE_CHECK_PER_HOST', '2'))
+# 检查模式：head（HEAD优先，只读取正文开头）或 get（直接GET，只读取正文开头）
+WEBSITE_CHECK_MODE = os.getenv('WEBSITE_CHECK_MODE', 'head')
+WEBSITE_CHECK_SAMPLE_BYTES = int(os.getenv('WEBSITE_CHECK_SAMPLE_BYTES', '4096'))
 WEBSITE_CHECK_KEYWORDS = ['半导体', 'IC', '芯片', '集成电路', 'semiconductor']
 
+# 新闻分类配置：按关键词命中得分选择分类，得分相同时取表中靠前的分类
+NEWS_CATEGORIES = {
+    '制造工艺': ['制造', '工艺', '制程', '7nm', '5nm', '3nm', '晶圆', '代工'],
+    '设计工具': ['eda', '设计', 'cadence', 'synopsys', 'mentor'],
+    '市场分析': ['市场', '预测', '分析', '增长', '营收', '份额', '报告'],
+    '投资并购': ['投资', '并购', '收购', '融资', '上市', '募资', '估值'],
+    '技术创新': ['技术', '创新', '突破', '专利', '研发', '算法', '架构'],
+    '政策法规': ['政策', '法规', '标准', '规范', '监管', '审查', '制裁'],
+    '人事变动': ['人事', '任命', '离职', '加入', 'ceo', 'cto', '高管'],
+    '产品发布': ['发布', '推出', '上市', '产品', '芯片', '处理器']
+}
+NEWS_DEFAULT_CATEGORY = '行业动态'
+# 关键词权重（未列出的为1.0），过于宽泛的词降低权重
+NEWS_CATEGORY_KEYWORD_WEIGHTS = {
+    '设计': 0.5, '分析': 0.5, '技术': 0.5, '产品': 0.5, '芯片': 0.5, '加入': 0.5,
+}
+# 标题中命中的关键词按该倍数计分
+NEWS_CATEGORY_TITLE_WEIGHT = float(os.getenv('NEWS_CATEGORY_TITLE_WEIGHT', '2.0'))
+
 # 过滤配置
 CONTENT_MIN_LENGTH = 50
-DUPLICATE_THRESHOLD_DAYS = 7
\ No newline at end of file
+DUPLICATE_THRESHOLD_DAYS = 7
+# 常驻调度器中新闻去重索引的复用时间（秒），超过后重新从数据库加载
+DEDUP_INDEX_TTL = int(os.getenv('DEDUP_INDEX_TTL', '43200'))
+# 标题近似重复判定阈值（字符3-gram的Jaccard相似度）；短标题中实体和数字只占少数字符，阈值过低会误判不同新闻
+NEAR_DUP_THRESHOLD = float(os.getenv('NEAR_DUP_THRESHOLD', '0.8'))
\ No newline at end of file
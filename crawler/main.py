@@ -10,10 +10,8 @@ import sys
 from datetime import datetime
 from loguru import logger
 
-from scheduler import CrawlerScheduler
-from scrapers.news_scraper import run_news_scraper
-from scrapers.website_checker import run_website_checker
-from scrapers.iccircle_scraper import run_iccircle_scraper
+# 爬虫和调度器依赖较重（aiohttp、bs4、jieba等），在对应命令中才导入，
+# 使 status 等简单命令快速启动
 from utils.database import db
 
 def setup_logger(log_level: str = "INFO"):
@@ -35,6 +33,7 @@ def setup_logger(log_level: str = "INFO"):
 async def run_news_task():
     """运行新闻爬取任务"""
     logger.info("🚀 Starting news scraping task")
+    from scrapers.news_scraper import run_news_scraper
     
     try:
         results = await run_news_scraper()
@@ -55,6 +54,7 @@ async def run_news_task():
 async def run_website_task():
     """运行网站检查任务"""
     logger.info("🔍 Starting website checking task")
+    from scrapers.website_checker import run_website_checker
     
     try:
         results = await run_website_checker()
@@ -63,6 +63,8 @@ async def run_website_task():
         logger.info(f"  - Total checked: {results['total_checked']}")
         logger.info(f"  - Available: {results['available']}")
         logger.info(f"  - Unavailable: {results['unavailable']}")
+        if results.get('response_time_p50') is not None:
+            logger.info(f"  - Response time p50: {results['response_time_p50']:.2f}s, p95: {results['response_time_p95']:.2f}s")
         
         if results['errors']:
             logger.warning(f"  - Errors: {len(results['errors'])}")
@@ -79,6 +81,7 @@ async def run_website_task():
 async def run_iccircle_task():
     """运行IC技术圈爬虫任务"""
     logger.info("🎯 Starting IC Circle scraping task")
+    from scrapers.iccircle_scraper import run_iccircle_scraper
     
     try:
         results = await run_iccircle_scraper()
@@ -179,54 +182,47 @@ async def run_remove_inactive_task():
         raise
 
 async def run_update_task():
-    """运行完整数据更新任务（清理+爬取）"""
+    """
+    运行完整数据更新任务（清理+爬取）
+
+    各阶段按依赖关系并发运行：清理完成后同时开始新闻、IC技术圈和网站检查，
+    新闻爬取完成后生成AI概要
+    """
     logger.info("🔄 Starting complete data update task")
+    from utils.http_client import http_client
+    from utils.task_graph import TaskGraph
+    
+    graph = TaskGraph()
+    graph.add("cleanup", run_cleanup_task)
+    graph.add("news", run_news_task, depends_on=["cleanup"])
+    graph.add("iccircle", run_iccircle_task, depends_on=["cleanup"])
+    graph.add("websites", run_website_task, depends_on=["cleanup"])
+    graph.add("ai_summary", run_ai_summary_task, depends_on=["news"])
     
+    # 各阶段共享同一个HTTP会话
+    await http_client.acquire()
     try:
-        # 1. 先清理重复数据
-        logger.info("Step 1: Cleaning duplicate data...")
-        cleanup_results = await run_cleanup_task()
-        
-        await asyncio.sleep(2)  # 短暂等待
-        
-        # 2. 爬取最新新闻
-        logger.info("Step 2: Fetching latest news...")
-        news_results = await run_news_task()
-        
-        await asyncio.sleep(2)  # 短暂等待
-        
-        # 3. 爬取IC技术圈公众号
-        logger.info("Step 3: Fetching IC Circle WeChat accounts...")
-        iccircle_results = await run_iccircle_task()
-        
-        await asyncio.sleep(2)  # 短暂等待
-        
-        # 4. 生成AI概要
-        logger.info("Step 4: Generating AI summaries...")
-        ai_summary_results = await run_ai_summary_task()
-        
-        await asyncio.sleep(2)  # 短暂等待
-        
-        # 5. 检查网站状态
-        logger.info("Step 5: Checking website status...")
-        website_results = await run_website_task()
-        
+        results = await graph.run()
         logger.success("✅ Complete data update finished")
-        return {
-            "cleanup": cleanup_results,
-            "news": news_results,
-            "iccircle": iccircle_results,
-            "ai_summary": ai_summary_results,
-            "websites": website_results
-        }
+        return results
         
     except Exception as e:
         logger.error(f"❌ Data update failed: {e}")
         raise
+    
+    finally:
+        await http_client.release()
+        
+        logger.info("⏱️ Stage timings:")
+        for name, timing in sorted(graph.timings.items(), key=lambda item: item[1].started):
+            logger.info(f"  - {name}: started +{timing.started:.1f}s, took {timing.duration:.1f}s ({timing.status})")
+        path, length = graph.critical_path()
+        logger.info(f"  - Critical path: {' → '.join(path)} ({length:.1f}s)")
 
 def run_scheduler():
     """运行定时调度器"""
     logger.info("⏰ Starting crawler scheduler")
+    from scheduler import CrawlerScheduler
     
     try:
         scheduler = CrawlerScheduler()
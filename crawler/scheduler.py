@@ -1,18 +1,202 @@
 import asyncio
-import schedule
-import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from loguru import logger
-from typing import Dict, Any
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Set, Tuple
 
-from config.settings import SCHEDULE_NEWS_HOURS, SCHEDULE_WEBSITES_DAYS
-from scrapers.news_scraper import run_news_scraper
-from scrapers.website_checker import run_website_checker
+from config.settings import (
+    SCHEDULE_NEWS_HOURS, SCHEDULE_WEBSITES_DAYS, SCHEDULER_STATE_PATH, SCHEDULER_CATCHUP_INTERVAL
+)
 from utils.database import db
+from utils.http_client import http_client
+from utils.state_store import JsonStateStore
+
+# 距离下次任务很久时也定期醒来重新计算，以应对系统时间调整
+MAX_SLEEP_SECONDS = 300
+# 同一任务的多个触发时间相距不超过该时长时合并为一次运行（如补跑与相邻的正常触发）
+TRIGGER_MERGE_WINDOW = timedelta(minutes=30)
+
+
+class IntervalTrigger:
+    """
+    固定间隔触发
+
+    不指定 anchor 时从注册时刻起每隔 interval 触发，含义是"至少每隔 interval 运行一次"；
+    指定 anchor（HH:MM，本地时间）时按每天从该时间起的固定网格触发，interval 必须能整除一天
+    """
+
+    def __init__(self, anchor: Optional[str] = None, **interval):
+        self.interval = timedelta(**interval)
+        self.anchor: Optional[Tuple[int, int]] = None
+        if anchor is not None:
+            if timedelta(days=1) % self.interval:
+                raise ValueError(f"Anchored interval {self.interval} must divide one day")
+            hour, minute = anchor.split(':')
+            self.anchor = (int(hour), int(minute))
+
+    @property
+    def period(self) -> timedelta:
+        return self.interval
+
+    def next_run(self, after: datetime) -> datetime:
+        if self.anchor is None:
+            return after + self.interval
+        base = after.replace(hour=self.anchor[0], minute=self.anchor[1], second=0, microsecond=0)
+        steps = (after - base) // self.interval + 1
+        return base + steps * self.interval
+
+    def fires_at(self, hour: int, minute: int) -> bool:
+        """锚定网格是否包含每天的该时间"""
+        if self.anchor is None:
+            return False
+        offset = timedelta(hours=hour - self.anchor[0], minutes=minute - self.anchor[1])
+        return offset % self.interval == timedelta(0)
+
+    def covers(self, other) -> bool:
+        """本触发器运行时 other 的每次触发都已满足（other 可以去掉）"""
+        if isinstance(other, IntervalTrigger):
+            if other.anchor is None:
+                return self.period <= other.interval
+            return other.interval % self.interval == timedelta(0) and self.fires_at(*other.anchor)
+        if isinstance(other, DailyTrigger):
+            return self.fires_at(other.hour, other.minute)
+        return False
+
+    def __str__(self) -> str:
+        if self.anchor is None:
+            return f"every {self.interval}"
+        return f"every {self.interval} from {self.anchor[0]:02d}:{self.anchor[1]:02d}"
+
+
+class DailyTrigger:
+    """每天（或每周指定一天）的固定时间触发，使用本地时间"""
+
+    WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+    def __init__(self, at: str, weekday: Optional[str] = None):
+        hour, minute = at.split(':')
+        self.hour = int(hour)
+        self.minute = int(minute)
+        self.weekday = self.WEEKDAYS.index(weekday) if weekday else None
+
+    @property
+    def period(self) -> timedelta:
+        return timedelta(days=1 if self.weekday is None else 7)
+
+    def next_run(self, after: datetime) -> datetime:
+        candidate = after.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        if candidate <= after:
+            candidate += timedelta(days=1)
+        if self.weekday is not None:
+            candidate += timedelta(days=(self.weekday - candidate.weekday()) % 7)
+        return candidate
+
+    def covers(self, other) -> bool:
+        """本触发器运行时 other 的每次触发都已满足（other 可以去掉）"""
+        if isinstance(other, DailyTrigger):
+            return (self.hour, self.minute) == (other.hour, other.minute) and self.weekday in (None, other.weekday)
+        if isinstance(other, IntervalTrigger) and other.anchor is None:
+            return self.period <= other.interval
+        return False
+
+    def __str__(self) -> str:
+        day = self.WEEKDAYS[self.weekday] if self.weekday is not None else 'day'
+        return f"every {day} at {self.hour:02d}:{self.minute:02d}"
+
+
+class ScheduledJob:
+    """
+    定时任务
+    一个任务可以有多个触发器，任一触发器到期即运行；
+    同一时间只运行一个实例，运行中到期的触发会合并到当前运行
+    """
+
+    def __init__(self, name: str, description: str, func: Callable[[], Awaitable[Any]]):
+        self.name = name
+        self.description = description
+        self.func = func
+        self.triggers: List[Any] = []
+        self.trigger_runs: List[datetime] = []
+        self.catchup_at: Optional[datetime] = None
+        self.running: Optional[asyncio.Task] = None
+        # 上次运行记录：last_started / last_success / duration / outcome
+        self.state: Dict[str, Any] = {}
+
+    def add_trigger(self, trigger) -> bool:
+        """
+        添加触发器，已被其他触发器覆盖的触发器不会添加，新触发器覆盖的已有触发器会被移除
+
+        Returns:
+            是否添加
+        """
+        for existing in self.triggers:
+            if existing.covers(trigger):
+                logger.info(f"Dropping trigger '{trigger}' of {self.description}: covered by '{existing}'")
+                return False
+        for index in reversed(range(len(self.triggers))):
+            if trigger.covers(self.triggers[index]):
+                logger.info(f"Dropping trigger '{self.triggers[index]}' of {self.description}: covered by '{trigger}'")
+                del self.triggers[index]
+                del self.trigger_runs[index]
+        self.triggers.append(trigger)
+        self.trigger_runs.append(trigger.next_run(datetime.now()))
+        return True
+
+    @property
+    def next_run(self) -> datetime:
+        if self.catchup_at is not None:
+            return min(self.trigger_runs + [self.catchup_at])
+        return min(self.trigger_runs)
+
+    def advance(self, now: datetime) -> None:
+        """本次运行覆盖所有在合并窗口内到期的触发器，把它们推进到下一次"""
+        for index, trigger in enumerate(self.triggers):
+            due = self.trigger_runs[index]
+            if due <= now + TRIGGER_MERGE_WINDOW:
+                self.trigger_runs[index] = trigger.next_run(max(now, due))
+        if self.catchup_at is not None and self.catchup_at <= now + TRIGGER_MERGE_WINDOW:
+            self.catchup_at = None
+
+    def restore(self, state: Optional[Dict[str, Any]], now: datetime) -> bool:
+        """
+        根据上次运行记录恢复各触发器的下次运行时间
+
+        Returns:
+            上次运行之后是否有触发时间已经错过（需要补跑）
+        """
+        self.state = dict(state or {})
+        if not self.state.get('last_started'):
+            return False
+
+        last_started = datetime.fromisoformat(self.state['last_started'])
+        # 上次运行被进程退出打断时同样需要补跑
+        missed = self.state.get('outcome') in ('running', 'cancelled')
+        for index, trigger in enumerate(self.triggers):
+            due = trigger.next_run(last_started)
+            if due <= now:
+                # 无论错过多少次都只补跑一次，之后按正常节奏继续
+                missed = True
+                due = trigger.next_run(now)
+            self.trigger_runs[index] = due
+        return missed
+
+    def __str__(self) -> str:
+        return f"{self.description} ({', '.join(str(trigger) for trigger in self.triggers)})"
+
 
 class CrawlerScheduler:
+    """
+    基于asyncio的调度器
+    所有任务作为同一个常驻事件循环上的Task运行，按下次运行时间精确休眠，
+    HTTP连接池、DNS缓存、去重索引等资源在任务之间复用
+    """
+
     def __init__(self):
         self.is_running = False
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.state_store = JsonStateStore(SCHEDULER_STATE_PATH)
         self.setup_logger()
         self.setup_schedules()
 
@@ -26,71 +210,135 @@ class CrawlerScheduler:
             format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}"
         )
 
+    def add_job(self, name: str, trigger, func: Callable[[], Awaitable[Any]],
+                description: Optional[str] = None) -> ScheduledJob:
+        """
+        注册定时任务，同名任务的触发器合并到同一个任务上
+
+        Args:
+            name: 任务类型，同一类型同一时间只运行一个实例
+            trigger: 触发器
+            func: 任务函数
+            description: 任务描述（用于日志）
+        """
+        job = self.jobs.get(name)
+        if job is None:
+            job = self.jobs[name] = ScheduledJob(name, description or name, func)
+        elif job.func != func:
+            raise ValueError(f"Job '{name}' is already registered with a different function")
+        job.add_trigger(trigger)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
     def setup_schedules(self):
         """设置定时任务"""
-        # 每4小时爬取一次新闻
-        schedule.every(4).hours.do(self.run_async_task, 
-                                   "news", "news scraping")
-        
-        # 每天早上8点检查网站状态
-        schedule.every().day.at("08:00").do(self.run_async_task, 
-                                            "websites", "website checking")
-        
+        # 新闻爬取：每4小时一次，网格锚定在配置的整点上（选与最多配置整点重合的一个），
+        # 与网格重合的每日整点由间隔触发器覆盖，不再单独运行
+        news_interval = timedelta(hours=4)
+        anchor_hour = max(SCHEDULE_NEWS_HOURS, key=lambda hour: sum(
+            timedelta(hours=other - hour) % news_interval == timedelta(0) for other in SCHEDULE_NEWS_HOURS
+        ))
+        self.add_job("news", IntervalTrigger(anchor=f"{anchor_hour:02d}:00", hours=4),
+                     self.scheduled_news_scraping, "news scraping")
+        for hour in SCHEDULE_NEWS_HOURS:
+            self.add_job("news", DailyTrigger(f"{hour:02d}:00"), self.scheduled_news_scraping)
+
+        # 网站检查：每天早上8点，并保证至少每隔 SCHEDULE_WEBSITES_DAYS 天运行一次（每日检查已满足时不再单独运行）
+        self.add_job("websites", DailyTrigger("08:00"), self.scheduled_website_checking, "website checking")
+        self.add_job("websites", IntervalTrigger(days=SCHEDULE_WEBSITES_DAYS), self.scheduled_website_checking)
+
         # 每周日凌晨2点爬取IC技术圈公众号（更新频率较低）
-        schedule.every().sunday.at("02:00").do(self.run_async_task, 
-                                               "iccircle", "IC Circle scraping")
-        
+        self.add_job("iccircle", DailyTrigger("02:00", weekday="sunday"), self.run_iccircle_scraping,
+                     "IC Circle scraping")
+
         # 每天凌晨3点清理重复数据
-        schedule.every().day.at("03:00").do(self.run_async_task, 
-                                            "cleanup", "database cleanup")
-        
+        self.add_job("cleanup", DailyTrigger("03:00"), self.run_cleanup, "database cleanup")
+
         # 每天上午10点生成AI概要
-        schedule.every().day.at("10:00").do(self.run_async_task,
-                                            "ai_summary", "AI summary generation")
-        
-        # 新闻爬取任务 - 每天指定时间运行
-        for hour in SCHEDULE_NEWS_HOURS:
-            schedule.every().day.at(f"{hour:02d}:00").do(self.scheduled_news_scraping)
-        
-        # 网站检查任务 - 每周运行
-        schedule.every(SCHEDULE_WEBSITES_DAYS).days.do(self.scheduled_website_checking)
-        
-        # 立即运行一次新闻爬取（可选）
-        # schedule.every().minute.do(self.scheduled_news_scraping).tag('immediate')
-        
-        logger.info(f"Scheduled news scraping at hours: {SCHEDULE_NEWS_HOURS}")
-        logger.info(f"Scheduled website checking every {SCHEDULE_WEBSITES_DAYS} days")
-
-    def run_async_task(self, task_type, task_name):
-        """运行异步任务"""
-        logger.info(f"Starting {task_name}")
-        
+        self.add_job("ai_summary", DailyTrigger("10:00"), self.run_ai_summary, "AI summary generation")
+
+        logger.info(f"Scheduled {self.jobs['news']}")
+        logger.info(f"Scheduled {self.jobs['websites']}")
+
+    def _save_job_state(self, job: ScheduledJob, **changes) -> None:
+        """更新任务运行记录并立即写回，进程随时退出也不会丢失"""
+        job.state.update(changes)
+        self.state_store.set(job.name, dict(job.state))
+        self.state_store.save()
+
+    def restore_state(self, skip: Optional[List[str]] = None) -> List[ScheduledJob]:
+        """
+        加载持久化的任务运行记录，为停机期间错过的任务安排补跑
+
+        每个任务最多补跑一次，多个补跑之间间隔 SCHEDULER_CATCHUP_INTERVAL 秒，避免启动时同时运行
+
+        Args:
+            skip: 不需要补跑的任务（如启动时本来就会运行的任务）
+        """
+        now = datetime.now()
+        catchups = []
+        for job in self.jobs.values():
+            missed = job.restore(self.state_store.get(job.name), now)
+            if missed and job.name not in (skip or []):
+                job.catchup_at = now + timedelta(seconds=SCHEDULER_CATCHUP_INTERVAL * len(catchups))
+                catchups.append(job)
+                logger.info(f"{job.description} missed a run since {job.state['last_started']}, "
+                            f"catching up at {job.catchup_at:%Y-%m-%d %H:%M:%S}")
+        return catchups
+
+    async def run_job(self, job: ScheduledJob) -> Any:
+        """运行单个任务，异常只记录不向外抛出"""
+        logger.info(f"Starting {job.description}")
+        started = datetime.now()
+        self._save_job_state(job, last_started=started.isoformat(), outcome='running')
+        outcome = 'error'
         try:
-            if task_type == "news":
-                results = asyncio.run(self.run_news_scraping())
-            elif task_type == "websites":
-                results = asyncio.run(self.run_website_checking())
-            elif task_type == "iccircle":
-                results = asyncio.run(self.run_iccircle_scraping())
-            elif task_type == "cleanup":
-                results = asyncio.run(self.run_cleanup())
-            elif task_type == "ai_summary":
-                results = asyncio.run(self.run_ai_summary())
-            else:
-                logger.error(f"Unknown task type: {task_type}")
-                return
-            
-            logger.success(f"{task_name} completed successfully")
-            
+            results = await job.func()
+            outcome = 'success'
+            logger.success(f"{job.description} completed successfully")
+            return results
+        except asyncio.CancelledError:
+            outcome = 'cancelled'
+            raise
         except Exception as e:
-            logger.error(f"Error in {task_name}: {e}")
+            logger.error(f"Error in {job.description}: {e}")
+            return None
+        finally:
+            finished = datetime.now()
+            changes = {'duration': round((finished - started).total_seconds(), 3), 'outcome': outcome}
+            if outcome == 'success':
+                changes['last_success'] = finished.isoformat()
+            self._save_job_state(job, **changes)
+
+    def _launch(self, job: ScheduledJob) -> asyncio.Task:
+        """
+        把任务作为后台Task启动，不阻塞调度循环
+
+        同一任务已在运行时不再启动新实例，直接返回正在运行的Task
+        """
+        if job.running is not None and not job.running.done():
+            logger.info(f"{job.description} is already running, joining the current run")
+            return job.running
+
+        task = self._loop.create_task(self.run_job(job), name=job.name)
+        job.running = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def trigger(self, name: str) -> Any:
+        """立即触发指定任务并等待结果，任务已在运行时等待当前这次运行"""
+        return await asyncio.shield(self._launch(self.jobs[name]))
 
     async def run_news_scraping(self):
         """运行新闻爬取"""
+        from scrapers.news_scraper import run_news_scraper
         return await run_news_scraper()
 
     async def run_website_checking(self):
         """运行网站检查"""
+        from scrapers.website_checker import run_website_checker
         return await run_website_checker()
 
     async def run_iccircle_scraping(self):
@@ -104,10 +352,10 @@ class CrawlerScheduler:
         websites_cleaned = await db.clean_duplicate_websites()
         wechat_cleaned = await db.clean_duplicate_wechat_accounts()
         inactive_deleted = await db.delete_inactive_websites()
-        
+
         return {
             "news_cleaned": news_cleaned,
-            "websites_cleaned": websites_cleaned, 
+            "websites_cleaned": websites_cleaned,
             "wechat_cleaned": wechat_cleaned,
             "inactive_deleted": inactive_deleted
         }
@@ -117,81 +365,53 @@ class CrawlerScheduler:
         processed_count = await db.batch_process_ai_summaries(batch_size=10)
         return {"processed_count": processed_count}
 
-    def scheduled_news_scraping(self):
+    async def scheduled_news_scraping(self):
         """计划的新闻爬取任务"""
-        logger.info("Starting scheduled news scraping")
-        
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            results = loop.run_until_complete(self.run_news_scraping())
-            
+            results = await self.run_news_scraping()
+
             total_items = sum(results.values())
             logger.success(f"Scheduled news scraping completed. Total items: {total_items}")
-            
+
             # 记录任务执行结果
-            loop.run_until_complete(
-                db.save_crawl_log(
-                    'scheduled_news_scraping',
-                    'success',
-                    f'Scraped {total_items} news items from {len(results)} sources',
-                    total_items
-                )
+            await db.save_crawl_log(
+                'scheduled_news_scraping',
+                'success',
+                f'Scraped {total_items} news items from {len(results)} sources',
+                total_items
             )
-            
+            return results
+
         except Exception as e:
-            logger.error(f"Error in scheduled news scraping: {e}")
-            asyncio.run(
-                db.save_crawl_log(
-                    'scheduled_news_scraping',
-                    'error',
-                    str(e)
-                )
-            )
-        finally:
-            loop.close()
+            await db.save_crawl_log('scheduled_news_scraping', 'error', str(e))
+            raise
 
-    def scheduled_website_checking(self):
+    async def scheduled_website_checking(self):
         """计划的网站检查任务"""
-        logger.info("Starting scheduled website checking")
-        
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            results = loop.run_until_complete(self.run_website_checking())
-            
+            results = await self.run_website_checking()
+
             logger.success(f"Scheduled website checking completed. "
                          f"Available: {results['available']}, "
                          f"Unavailable: {results['unavailable']}")
-            
+
             # 记录任务执行结果
-            loop.run_until_complete(
-                db.save_crawl_log(
-                    'scheduled_website_checking',
-                    'success',
-                    f'Checked {results["total_checked"]} websites',
-                    results['total_checked']
-                )
+            await db.save_crawl_log(
+                'scheduled_website_checking',
+                'success',
+                f'Checked {results["total_checked"]} websites',
+                results['total_checked']
             )
-            
+            return results
+
         except Exception as e:
-            logger.error(f"Error in scheduled website checking: {e}")
-            asyncio.run(
-                db.save_crawl_log(
-                    'scheduled_website_checking',
-                    'error',
-                    str(e)
-                )
-            )
-        finally:
-            loop.close()
+            await db.save_crawl_log('scheduled_website_checking', 'error', str(e))
+            raise
 
     def run_manual_task(self, task_type: str) -> Dict[str, Any]:
-        """手动运行指定任务"""
+        """手动运行指定任务（在调度器之外单独运行）"""
         logger.info(f"Running manual task: {task_type}")
-        
+
         try:
             if task_type == 'news':
                 return asyncio.run(self.run_news_scraping())
@@ -199,98 +419,96 @@ class CrawlerScheduler:
                 return asyncio.run(self.run_website_checking())
             else:
                 raise ValueError(f"Unknown task type: {task_type}")
-                
+
         except Exception as e:
             logger.error(f"Error in manual task {task_type}: {e}")
             raise
 
-    def start(self):
-        """启动调度器"""
-        logger.info("Starting crawler scheduler")
+    async def run_forever(self, run_on_start: Optional[List[str]] = None):
+        """
+        调度主循环
+
+        Args:
+            run_on_start: 启动时立即运行一次的任务名称
+        """
+        from utils.translator import translator
+
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self.is_running = True
-        
-        # 清除立即执行的任务
-        schedule.clear('immediate')
-        
-        while self.is_running:
-            try:
-                schedule.run_pending()
-                time.sleep(60)  # 每分钟检查一次
-                
-            except KeyboardInterrupt:
-                logger.info("Received keyboard interrupt, stopping scheduler")
-                self.stop()
-                break
-                
-            except Exception as e:
-                logger.error(f"Error in scheduler main loop: {e}")
-                time.sleep(60)
+
+        # 调度器运行期间一直持有共享HTTP会话和翻译器，连接池、DNS缓存和DeepL客户端在各任务之间复用
+        await http_client.acquire()
+        translator.acquire()
+        try:
+            self.restore_state(skip=run_on_start)
+            for name in run_on_start or []:
+                self._launch(self.jobs[name])
+
+            while self.is_running:
+                now = datetime.now()
+                for job in self.jobs.values():
+                    if job.next_run <= now:
+                        self._launch(job)
+                        job.advance(now)
+
+                # 休眠到最近一个任务的运行时间，新增任务或停止时提前唤醒
+                next_run = min((job.next_run for job in self.jobs.values()), default=None)
+                delay = MAX_SLEEP_SECONDS
+                if next_run is not None:
+                    delay = min(max((next_run - datetime.now()).total_seconds(), 0), MAX_SLEEP_SECONDS)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self.is_running = False
+            for task in list(self._tasks):
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*list(self._tasks), return_exceptions=True)
+            await translator.release()
+            await http_client.release()
+            self._wakeup = None
+
+    def start(self, run_on_start: Optional[List[str]] = None):
+        """启动调度器（阻塞，直到停止）"""
+        logger.info("Starting crawler scheduler")
+        asyncio.run(self.run_forever(run_on_start))
 
     def stop(self):
-        """停止调度器"""
+        """停止调度器，可以在其他线程中调用"""
         logger.info("Stopping crawler scheduler")
         self.is_running = False
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
 
     def get_next_scheduled_runs(self) -> Dict[str, Any]:
         """获取下次运行时间"""
-        next_runs = {}
-        
-        for job in schedule.jobs:
-            next_runs[str(job.job_func)] = job.next_run
-        
-        return next_runs
+        return {str(job): job.next_run for job in self.jobs.values()}
 
     def get_schedule_status(self) -> Dict[str, Any]:
         """获取调度器状态"""
         return {
             'is_running': self.is_running,
-            'total_jobs': len(schedule.jobs),
+            'total_jobs': len(self.jobs),
+            'running_jobs': len(self._tasks),
             'next_runs': self.get_next_scheduled_runs(),
+            'jobs': {name: self.state_store.get(name, {}) for name in self.jobs},
             'news_hours': SCHEDULE_NEWS_HOURS,
             'website_check_days': SCHEDULE_WEBSITES_DAYS
         }
 
-    def run_with_error_handling(self, func, task_name):
-        """运行任务并处理错误"""
-        logger.info(f"Starting {task_name}")
-        
-        try:
-            results = func()
-            logger.success(f"{task_name} completed successfully")
-            
-            # 记录任务执行结果
-            asyncio.run(
-                db.save_crawl_log(
-                    task_name,
-                    'success',
-                    f'Completed {len(results)} tasks',
-                    len(results)
-                )
-            )
-            
-        except Exception as e:
-            logger.error(f"Error in {task_name}: {e}")
-            asyncio.run(
-                db.save_crawl_log(
-                    task_name,
-                    'error',
-                    str(e)
-                )
-            )
-
 def main():
     """主函数"""
     scheduler = CrawlerScheduler()
-    
+
     try:
-        # 可以选择立即运行一次
+        # 启动时立即运行一次新闻爬取，然后进入定时调度
         logger.info("Running initial news scraping...")
-        initial_results = scheduler.run_manual_task('news')
-        logger.info(f"Initial scraping results: {initial_results}")
-        
-        # 启动定时调度
-        scheduler.start()
-        
+        scheduler.start(run_on_start=["news"])
+
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user")
     except Exception as e:
@@ -299,4 +517,4 @@ def main():
         scheduler.stop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
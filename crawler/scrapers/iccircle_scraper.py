@@ -1,13 +1,13 @@
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from loguru import logger
 from urllib.parse import urljoin, urlparse
 
-from config.settings import USER_AGENT, CRAWL_DELAY
+from config.settings import CRAWL_DELAY
 from utils.database import db
+from utils.http_client import http_client
+from utils.html_parser import make_soup
 from utils.helpers import clean_text, normalize_url, is_valid_ic_content
 
 class ICCircleScraper:
@@ -17,15 +17,13 @@ class ICCircleScraper:
         self.member_url = "https://iccircle.com/member"
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': USER_AGENT}
-        )
+        self.session = await http_client.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            await http_client.release()
+            self.session = None
 
     async def scrape_wechat_accounts(self) -> List[Dict[str, Any]]:
         """爬取IC技术圈成员的微信公众号"""
@@ -37,7 +35,7 @@ class ICCircleScraper:
             async with self.session.get(self.member_url) as response:
                 if response.status == 200:
                     content = await response.text()
-                    soup = BeautifulSoup(content, 'html.parser')
+                    soup = make_soup(content)
                     
                     # 根据页面结构解析成员信息
                     # 这里需要根据实际页面结构来调整选择器
@@ -1,21 +1,36 @@
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
+import copy
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Tuple
 from loguru import logger
 from urllib.parse import urljoin, urlparse
 
-from config.settings import NEWS_SOURCES, USER_AGENT, CRAWL_DELAY, DUPLICATE_THRESHOLD_DAYS
+from config.settings import (
+    NEWS_SOURCES, CONCURRENT_REQUESTS,
+    ARTICLE_FETCH_CONCURRENCY, ARTICLE_FETCH_TIMEOUT, HTTP_VALIDATORS_PATH,
+    SOURCE_WATERMARKS_PATH, DEDUP_INDEX_TTL, PIPELINE_QUEUE_SIZE,
+    PIPELINE_PARSE_WORKERS, PIPELINE_FILTER_WORKERS, PIPELINE_TRANSLATE_WORKERS,
+    PIPELINE_SAVE_WORKERS
+)
 from utils.database import db
+from utils.http_client import http_client
+from utils.html_parser import make_soup
+from utils.content_extractor import UNWANTED_TAGS, extract_content
 from utils.helpers import (
     clean_text, extract_summary, parse_date, 
-    categorize_news_content, validate_news_data, 
-    normalize_url, is_valid_ic_content
+    validate_news_data, 
+    normalize_url, analyze_news_content
 )
 from utils.ai_summarizer import generate_news_summary
-from utils.translator import translate_text
+from utils.translator import translate_text, translator
+from utils.rate_limiter import HostRateLimiter
+from utils.dedup import NearDuplicateTitleIndex
+from utils.state_store import JsonStateStore
+from utils.watermark import SourceWatermark
+from utils.date_parser import date_parser
+from utils.feed_parser import FEED_CHUNK_SIZE, iter_feed_items
+from utils.pipeline import Pipeline, Stage
 
 def is_english(text: str) -> bool:
     """简单的英文检测，判断文本是否主要为英文"""
@@ -28,341 +43,463 @@ def is_english(text: str) -> bool:
     chinese_chars = sum(1 for char in text if '\u4e00' <= char <= '\u9fff')
     return english_word_count > 3 and chinese_chars < len(text) * 0.1 # 简单判断，如果英文单词多且中文字符少于10%
 
+def _find_first(element: ET.Element, *tags: str) -> Optional[ET.Element]:
+    """按顺序查找第一个存在的子元素（Element没有子节点时为假值，不能用 or 连接）"""
+    for tag in tags:
+        found = element.find(tag)
+        if found is not None:
+            return found
+    return None
+
 class NewsScraper:
     def __init__(self):
         self.session = None
-        self.recent_titles = []
+        self.title_index = NearDuplicateTitleIndex()
+        self.rate_limiter = HostRateLimiter()
+        # 各源URL的 ETag / Last-Modified，只有在本次内容处理完成后才会提交
+        self.http_validators = JsonStateStore(HTTP_VALIDATORS_PATH)
+        self.pending_validators: Dict[str, Dict[str, str]] = {}
+        # 各源的增量爬取位置，同样在条目保存完成后提交
+        self.source_watermarks = JsonStateStore(SOURCE_WATERMARKS_PATH)
+        self.pending_watermarks: Dict[str, SourceWatermark] = {}
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': USER_AGENT}
-        )
+        # 共享会话默认校验证书；部分新闻站点证书有问题，新闻相关请求单独禁用SSL验证
+        self.session = await http_client.acquire()
+        translator.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # 调度器持有翻译器时只发送剩余批次，HTTP客户端留给下一次运行
+        await translator.release()
         if self.session:
-            await self.session.close()
+            await http_client.release()
+            self.session = None
 
     async def scrape_all_sources(self) -> Dict[str, int]:
         """爬取所有新闻源"""
         logger.info("Starting news scraping for all sources")
+        # 日期解析统计是全局累计的，记录本次运行开始时的快照
+        date_stats_snapshot = date_parser.get_stats()
         
-        # 获取最近的新闻标题用于去重
-        self.recent_titles = await db.get_recent_news_titles(DUPLICATE_THRESHOLD_DAYS)
-        logger.info(f"Found {len(self.recent_titles)} recent news titles for deduplication")
+        # 加载本地去重索引，之后保存新闻时不再逐条查询数据库（常驻调度器中在有效期内复用）
+        await db.load_dedup_index(max_age=DEDUP_INDEX_TTL)
         
-        results = {}
+        # 用去重索引已分页加载的最近新闻标题构建近似重复索引，用于快速过滤重复或改写后重发的新闻
+        recent_titles = db.get_dedup_titles()
+        logger.info(f"Found {len(recent_titles)} recent news titles for deduplication")
+        self.title_index = NearDuplicateTitleIndex()
+        for title in recent_titles:
+            self.title_index.add(title)
         
-        for source_config in NEWS_SOURCES:
-            try:
+        # 各新闻源并发爬取，并发数由 CONCURRENT_REQUESTS 限制
+        semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
+        counts = await asyncio.gather(*[
+            self.scrape_source(source_config, semaphore) for source_config in NEWS_SOURCES
+        ])
+        results = {source_config['name']: count for source_config, count in zip(NEWS_SOURCES, counts)}
+        
+        # 写入缓冲区中剩余的新闻
+        await db.flush_news()
+        self.http_validators.save()
+        self.source_watermarks.save()
+        
+        # 日期解析失败会导致发布时间不准确，按来源汇总提示本次运行的情况
+        for source, stats in date_parser.get_stats_since(date_stats_snapshot).items():
+            if stats['failures']:
+                logger.warning(f"Failed to parse {stats['failures']}/{stats['failures'] + stats['parsed']} dates from {source}")
+        
+        total_saved = sum(results.values())
+        logger.info(f"News scraping completed. Total saved: {total_saved}")
+        return results
+
+    async def scrape_source(self, source_config: Dict[str, Any], semaphore: asyncio.Semaphore) -> int:
+        """爬取单个新闻源并保存，返回保存数量"""
+        # 保存阶段只把新闻交给批量写入器，各条目的写入结果在流水线结束后统一等待
+        pending_writes: List[asyncio.Future] = []
+        try:
+            async with semaphore:
                 logger.info(f"Scraping news from: {source_config['name']}")
                 
+                # 按主机控制请求间隔，避免对同一站点请求过于频繁
+                source_url = source_config.get('rss') or source_config['url']
+                await self.rate_limiter.wait(source_url)
+                
+                # 条目边抓取边经过各阶段处理，解析完一条即可开始翻译和保存
                 if 'rss' in source_config:
-                    news_items = await self.scrape_rss_feed(source_config)
+                    # 水位线只推进到处理完成（已交给写入器、判为重复或被过滤）的条目，
+                    # 写入失败时下面不会提交水位线
+                    watermark = SourceWatermark.from_dict(self.source_watermarks.get(source_config['name']))
+                    new_watermark = SourceWatermark.from_dict(watermark.to_dict())
+                    pipeline = self.build_pipeline(
+                        source_config, pending_writes,
+                        on_finished=lambda entry: new_watermark.advance(entry[1], entry[2])
+                    )
+                    stats = await pipeline.run(self.iter_rss_entries(source_config, watermark, new_watermark))
                 else:
-                    news_items = await self.scrape_html_source(source_config)
-                
-                saved_count = 0
-                for item in news_items:
-                    if await self.save_news_item(item):
-                        saved_count += 1
-                
-                results[source_config['name']] = saved_count
-                logger.success(f"Saved {saved_count} news items from {source_config['name']}")
-                
-                # 添加延迟以避免过于频繁的请求
-                await asyncio.sleep(CRAWL_DELAY)
-                
-            except Exception as e:
-                logger.error(f"Error scraping {source_config['name']}: {e}")
-                results[source_config['name']] = 0
-                await db.save_crawl_log(source_config['name'], 'error', str(e))
+                    pipeline = self.build_pipeline(source_config, pending_writes)
+                    stats = await pipeline.run(self.iter_html_entries(source_config))
+            
+            # 等待本源各条目的写入结果（写入器按数量或时间间隔批量写入）
+            results = await asyncio.gather(*pending_writes, return_exceptions=True)
+            saved_count = sum(1 for result in results if result and not isinstance(result, BaseException))
+            write_failures = sum(1 for result in results if isinstance(result, BaseException))
+            failures = write_failures + sum(stage_stats['errors'] for stage_stats in stats.values())
+            
+            # 条目全部处理成功后才记录校验值和水位线；有条目处理或写入失败时保留上次的状态，
+            # 下次运行不会收到304，也不会把失败的条目当作已处理而跳过
+            if failures:
+                self.discard_source_state(source_config)
+                logger.warning(f"{failures} items from {source_config['name']} failed, "
+                               f"keeping previous validators and watermark so they are retried")
+            else:
+                self.commit_source_state(source_config)
+            
+            logger.success(f"Saved {saved_count} news items from {source_config['name']}")
+            return saved_count
+            
+        except Exception as e:
+            logger.error(f"Error scraping {source_config['name']}: {e}")
+            await db.save_crawl_log(source_config['name'], 'error', str(e))
+            return 0
+
+    def build_pipeline(self, source_config: Dict[str, Any], pending_writes: List[asyncio.Future],
+                       on_finished: Optional[Callable[[Any], None]] = None) -> Pipeline:
+        """
+        构建单个新闻源的处理流水线
+
+        RSS：解析 → 过滤 → 翻译 → 保存
+        HTML：过滤 → 抓取正文 → 翻译 → 保存（列表页已解析，先过滤再抓取正文，避免抓取无关文章）
+
+        保存阶段不等待写入完成，各条目写入结果的Future追加到 pending_writes
+        """
+        async def parse(entry: Tuple[ET.Element, Optional[str], Optional[datetime]]) -> Optional[Dict[str, Any]]:
+            item, _, published = entry
+            return self.parse_rss_item(item, source_config, published)
         
-        total_saved = sum(results.values())
-        logger.info(f"News scraping completed. Total saved: {total_saved}")
-        return results
+        async def filter_item(news_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            return self.filter_news_item(news_item, source_config)
+        
+        async def fetch(news_item: Dict[str, Any]) -> Dict[str, Any]:
+            await self.fetch_article_body(news_item, source_config)
+            return news_item
+        
+        async def translate(news_item: Dict[str, Any]) -> Dict[str, Any]:
+            await self.translate_news_item(news_item)
+            return news_item
+        
+        async def save(news_item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            write = await self.save_news_item(news_item)
+            if write is None:
+                return None
+            pending_writes.append(write)
+            return news_item
+        
+        if 'rss' in source_config:
+            stages = [
+                Stage('parse', parse, PIPELINE_PARSE_WORKERS),
+                Stage('filter', filter_item, PIPELINE_FILTER_WORKERS),
+            ]
+        else:
+            stages = [
+                Stage('filter', filter_item, PIPELINE_FILTER_WORKERS),
+                Stage('fetch', fetch, ARTICLE_FETCH_CONCURRENCY),
+            ]
+        stages += [
+            Stage('translate', translate, PIPELINE_TRANSLATE_WORKERS),
+            Stage('save', save, PIPELINE_SAVE_WORKERS),
+        ]
+        return Pipeline(stages, queue_size=PIPELINE_QUEUE_SIZE, on_finished=on_finished)
 
-    async def scrape_rss_feed(self, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """爬取RSS源"""
-        news_items = []
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """根据上次保存的校验值生成条件请求头"""
+        validators = self.http_validators.get(url) or {}
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        return headers
+
+    def remember_validators(self, url: str, response) -> None:
+        """暂存响应中的 ETag / Last-Modified，等待条目保存完成后提交"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.pending_validators[url] = {'etag': etag, 'last_modified': last_modified}
+
+    def commit_source_state(self, source_config: Dict[str, Any]) -> None:
+        """提交暂存的校验值和增量爬取位置"""
+        url = source_config.get('rss') or source_config['url']
+        validators = self.pending_validators.pop(url, None)
+        if validators:
+            self.http_validators.set(url, validators)
         
+        watermark = self.pending_watermarks.pop(source_config['name'], None)
+        if watermark:
+            self.source_watermarks.set(source_config['name'], watermark.to_dict())
+
+    def discard_source_state(self, source_config: Dict[str, Any]) -> None:
+        """丢弃暂存的校验值和增量爬取位置（本次有条目处理失败）"""
+        self.pending_validators.pop(source_config.get('rss') or source_config['url'], None)
+        self.pending_watermarks.pop(source_config['name'], None)
+
+    async def iter_rss_entries(self, source_config: Dict[str, Any], watermark: SourceWatermark,
+                               new_watermark: SourceWatermark
+                               ) -> AsyncIterator[Tuple[ET.Element, Optional[str], Optional[datetime]]]:
+        """
+        流式读取RSS源，逐个产出水位线 watermark 以上（未处理过）的条目及其GUID和发布时间
+
+        完整读取后把 new_watermark 暂存为待提交的水位线，由流水线在各条目处理完成时推进
+        """
         try:
-            # 配置SSL验证选项
-            connector = aiohttp.TCPConnector(ssl=False)
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={'User-Agent': USER_AGENT}
-            ) as session:
-                async with session.get(source_config['rss']) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        
-                        # 使用XML解析器解析RSS
+            url = source_config['rss']
+            async with self.session.get(url, headers=self.conditional_headers(url), ssl=False) as response:
+                if response.status == 304:
+                    logger.info(f"RSS feed not modified since last run: {source_config['name']}")
+                    return
+                if response.status != 200:
+                    return
+                
+                skipped = 0
+                entry_errors = 0
+                
+                # 流式解析RSS，边下载边处理条目；下游处理不过来时暂停读取
+                try:
+                    async for item in iter_feed_items(response.content.iter_chunked(FEED_CHUNK_SIZE)):
                         try:
-                            root = ET.fromstring(content)
-                            
-                            # 寻找RSS项目
-                            items = root.findall('.//item') or root.findall('.//{http://purl.org/rss/1.0/}item')
-                            
-                            for item in items:
-                                try:
-                                    # 提取基本信息
-                                    title_elem = item.find('title')
-                                    link_elem = item.find('link')
-                                    
-                                    if title_elem is None or link_elem is None:
-                                        continue
-                                    
-                                    title = clean_text(title_elem.text or '')
-                                    link = link_elem.text or ''
-                                    
-                                    # 跳过重复的新闻
-                                    if any(title.lower() in existing.lower() or existing.lower() in title.lower() 
-                                           for existing in self.recent_titles):
-                                        continue
-                                    
-                                    # 提取摘要
-                                    summary = ""
-                                    desc_elem = item.find('description') or item.find('summary')
-                                    if desc_elem is not None and desc_elem.text:
-                                        summary = clean_text(desc_elem.text)
-                                    
-                                    # 提取作者
-                                    author = ""
-                                    author_elem = item.find('author') or item.find('dc:creator', {'dc': 'http://purl.org/dc/elements/1.1/'})
-                                    if author_elem is not None and author_elem.text:
-                                        author = clean_text(author_elem.text)
-                                    
-                                    # 提取发布时间
-                                    published_at = datetime.now(timezone.utc).isoformat()
-                                    pubdate_elem = item.find('pubDate') or item.find('published')
-                                    if pubdate_elem is not None and pubdate_elem.text:
-                                        try:
-                                            parsed_date = parse_date(pubdate_elem.text)
-                                            if parsed_date:
-                                                published_at = parsed_date
-                                        except:
-                                            pass
-                                    
-                                    # 验证IC相关内容
-                                    content_text = f"{title} {summary}"
-                                    if not is_valid_ic_content(content_text):
-                                        continue
-                                    
-                                    news_item = {
-                                        'title': title,
-                                        'summary': summary,
-                                        'content': summary,  # RSS通常只有摘要
-                                        'source': source_config['name'],
-                                        'author': author,
-                                        'original_url': link,
-                                        'published_at': published_at,
-                                        'category': categorize_news_content(title, summary),
-                                        'crawled_at': datetime.now(timezone.utc),
-                                        'translated_title': None,
-                                        'translated_summary': None,
-                                        'translated_content': None,
-                                    }
-                                    
-                                    # 尝试翻译标题、摘要和内容
-                                    if is_english(news_item['title']):
-                                        news_item['translated_title'] = await translate_text(news_item['title'], "ZH")
-                                    if is_english(news_item['summary']):
-                                        news_item['translated_summary'] = await translate_text(news_item['summary'], "ZH")
-                                    if is_english(news_item['content']):
-                                        news_item['translated_content'] = await translate_text(news_item['content'], "ZH")
-
-                                    if validate_news_data(news_item):
-                                        # 暂时跳过AI概要生成（数据库字段尚未创建）
-                                        # await self.generate_ai_summary_for_item(news_item)
-                                        news_items.append(news_item)
-                                        
-                                except Exception as e:
-                                    logger.warning(f"Error parsing RSS entry: {e}")
-                                    continue
-                                    
-                        except ET.ParseError as e:
-                            logger.error(f"Error parsing RSS XML: {e}")
-                            
+                            guid = self.get_item_guid(item)
+                            pubdate_elem = _find_first(item, 'pubDate', 'published')
+                            item_published = date_parser.parse(
+                                pubdate_elem.text if pubdate_elem is not None else None, source_config['name']
+                            )
+                        except Exception as e:
+                            logger.warning(f"Error parsing RSS entry: {e}")
+                            entry_errors += 1
+                            continue
+                        
+                        # 增量爬取：跳过水位线以下（之前已处理过）的条目
+                        if watermark.is_processed(guid, item_published):
+                            skipped += 1
+                            continue
+                        
+                        # 条目在 iter_feed_items 中随后会被清空，复制一份交给下游阶段
+                        yield copy.deepcopy(item), guid, item_published
+                    
+                    # 只有完整解析成功且没有解析失败的条目时才记录校验值和水位线
+                    if entry_errors == 0:
+                        self.remember_validators(url, response)
+                        self.pending_watermarks[source_config['name']] = new_watermark
+                    if skipped:
+                        logger.info(f"Skipped {skipped} already processed items from {source_config['name']}")
+                
+                except ET.ParseError as e:
+                    logger.error(f"Error parsing RSS XML: {e}")
+                    
         except Exception as e:
             logger.error(f"Error fetching RSS feed {source_config['rss']}: {e}")
+
+    @staticmethod
+    def get_item_guid(item: ET.Element) -> Optional[str]:
+        """获取RSS条目的唯一标识（guid/id，缺失时使用链接）"""
+        guid_elem = _find_first(item, 'guid', 'id', 'link')
+        if guid_elem is not None and guid_elem.text:
+            return guid_elem.text.strip()
+        return None
+
+    def parse_rss_item(self, item: ET.Element, source_config: Dict[str, Any],
+                       published: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """解析单个RSS条目（published 为已解析的发布时间），缺少标题或链接时返回None"""
+        # 提取基本信息
+        title_elem = item.find('title')
+        link_elem = item.find('link')
             
-        return news_items
+        if title_elem is None or link_elem is None:
+            return None
+            
+        title = clean_text(title_elem.text or '')
+        link = link_elem.text or ''
+            
+        # 提取摘要
+        summary = ""
+        desc_elem = _find_first(item, 'description', 'summary')
+        if desc_elem is not None and desc_elem.text:
+            summary = clean_text(desc_elem.text)
+            
+        # 提取作者
+        author = ""
+        author_elem = _find_first(item, 'author', '{http://purl.org/dc/elements/1.1/}creator')
+        if author_elem is not None and author_elem.text:
+            author = clean_text(author_elem.text)
+            
+        # 发布时间无法解析时使用当前时间
+        published_at = (published or datetime.now(timezone.utc)).isoformat()
+            
+        # 暂时跳过AI概要生成（数据库字段尚未创建）
+        # await self.generate_ai_summary_for_item(news_item)
+        return {
+            'title': title,
+            'summary': summary,
+            'content': summary,  # RSS通常只有摘要
+            'source': source_config['name'],
+            'author': author,
+            'original_url': link,
+            'published_at': published_at,
+            'category': None,
+            'crawled_at': datetime.now(timezone.utc),
+            'translated_title': None,
+            'translated_summary': None,
+            'translated_content': None,
+        }
 
-    async def scrape_html_source(self, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """爬取HTML源"""
-        news_items = []
+    def filter_news_item(self, news_item: Dict[str, Any], source_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        过滤与IC无关的新闻并确定分类，不符合要求时返回None
+
+        这里只按去重索引跳过已保存的新闻（哈希查找），避免再抓取正文和翻译；
+        近似标题去重只在保存阶段做一次（加入标题索引之前）
+        """
+        if db.is_known_news(news_item['title'], news_item['original_url']):
+            return None
+        
+        # 验证IC相关内容并分类（一次关键词扫描）
+        keyword_match = analyze_news_content(news_item['title'], news_item['summary'])
+        if 'rss' in source_config:
+            is_relevant = keyword_match.is_relevant
+        else:
+            # 列表页只检查标题，正文在通过过滤后才抓取
+            is_relevant = keyword_match.title_relevant
+        if not is_relevant:
+            return None
+        news_item['category'] = keyword_match.category
         
+        if not validate_news_data(news_item):
+            return None
+        return news_item
+
+    async def iter_html_entries(self, source_config: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """获取HTML列表页，逐个产出新闻条目（不含正文）"""
         try:
-            # 配置SSL验证选项
-            connector = aiohttp.TCPConnector(ssl=False)  # 禁用SSL验证以解决证书问题
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={'User-Agent': USER_AGENT}
-            ) as session:
-                async with session.get(source_config['url']) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 根据配置的选择器提取新闻列表
-                        article_elements = soup.select(source_config['selectors']['list'])
-                        
-                        for element in article_elements:
-                            try:
-                                title_elem = element.select_one(source_config['selectors']['title'])
-                                link_elem = element.select_one(source_config['selectors']['link'])
-                                
-                                if not title_elem or not link_elem:
-                                    continue
-                                
-                                title = clean_text(title_elem.get_text())
-                                link = normalize_url(link_elem.get('href'), source_config['url'])
-                                
-                                # 跳过重复的新闻
-                                if title in self.recent_titles:
-                                    continue
-                                
-                                # 检查标题是否与IC相关
-                                if not is_valid_ic_content(title):
-                                    continue
-                                
-                                # 提取其他信息
-                                summary_elem = element.select_one(source_config['selectors'].get('summary', ''))
-                                date_elem = element.select_one(source_config['selectors'].get('date', ''))
-                                
-                                summary = clean_text(summary_elem.get_text()) if summary_elem else ''
-                                date_str = clean_text(date_elem.get_text()) if date_elem else ''
-                                
-                                news_item = {
-                                    'title': title,
-                                    'summary': summary,
-                                    'original_url': link,
-                                    'source': source_config['name'],
-                                    'published_at': parse_date(date_str),
-                                    'category': categorize_news_content(title, summary),
-                                    'tags': [source_config['name'], 'HTML'],
-                                    'translated_title': None,
-                                    'translated_summary': None,
-                                    'translated_content': None,
-                                }
-                                
-                                # 尝试获取完整内容
-                                full_content = await self.fetch_full_content(link, source_config)
-                                if full_content:
-                                    news_item['content'] = full_content
-                                    if not summary:
-                                        news_item['summary'] = extract_summary(full_content)
-                                
-                                # 尝试翻译标题、摘要和内容
-                                if is_english(news_item['title']):
-                                    news_item['translated_title'] = await translate_text(news_item['title'], "ZH")
-                                if is_english(news_item['summary']):
-                                    news_item['translated_summary'] = await translate_text(news_item['summary'], "ZH")
-                                if news_item.get('content') and is_english(news_item['content']):
-                                    news_item['translated_content'] = await translate_text(news_item['content'], "ZH")
-                                
-                                # 暂时跳过AI概要生成（数据库字段尚未创建）
-                                # await self.generate_ai_summary_for_item(news_item)
-                                
-                                news_items.append(news_item)
-                                
-                            except Exception as e:
-                                logger.warning(f"Error parsing article element: {e}")
-                                continue
-                            
+            url = source_config['url']
+            async with self.session.get(url, headers=self.conditional_headers(url), ssl=False) as response:
+                if response.status == 304:
+                    logger.info(f"Listing page not modified since last run: {source_config['name']}")
+                    return
+                if response.status != 200:
+                    return
+                content = await response.text()
+            
+            news_items = self.parse_html_listing(content, source_config)
+            self.remember_validators(url, response)
+        
         except Exception as e:
             logger.error(f"Error scraping HTML source {source_config['url']}: {e}")
+            return
+        
+        for news_item in news_items:
+            yield news_item
+
+    def parse_html_listing(self, content: str, source_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """解析HTML列表页，提取新闻条目（不含正文，未过滤）"""
+        news_items = []
+        soup = make_soup(content)
+        
+        # 根据配置的选择器提取新闻列表
+        article_elements = soup.select(source_config['selectors']['list'])
+        
+        for element in article_elements:
+            try:
+                title_elem = element.select_one(source_config['selectors']['title'])
+                link_elem = element.select_one(source_config['selectors']['link'])
+                
+                if not title_elem or not link_elem:
+                    continue
+                
+                title = clean_text(title_elem.get_text())
+                link = normalize_url(link_elem.get('href'), source_config['url'])
+                
+                # 提取其他信息
+                summary_elem = element.select_one(source_config['selectors'].get('summary', ''))
+                date_elem = element.select_one(source_config['selectors'].get('date', ''))
+                
+                summary = clean_text(summary_elem.get_text()) if summary_elem else ''
+                date_str = clean_text(date_elem.get_text()) if date_elem else ''
+                
+                news_items.append({
+                    'title': title,
+                    'summary': summary,
+                    'original_url': link,
+                    'source': source_config['name'],
+                    'published_at': parse_date(date_str, source_config['name']),
+                    'category': None,
+                    'tags': [source_config['name'], 'HTML'],
+                    'translated_title': None,
+                    'translated_summary': None,
+                    'translated_content': None,
+                })
+                
+            except Exception as e:
+                logger.warning(f"Error parsing article element: {e}")
+                continue
         
         return news_items
 
+    async def fetch_article_body(self, news_item: Dict[str, Any], source_config: Dict[str, Any]) -> None:
+        """获取文章正文（单篇超时由配置控制），失败时保留列表页中的信息"""
+        try:
+            full_content = await asyncio.wait_for(
+                self.fetch_full_content(news_item['original_url'], source_config),
+                timeout=ARTICLE_FETCH_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Timed out fetching full content from {news_item['original_url']}")
+            return
+        
+        if full_content:
+            news_item['content'] = full_content
+            if not news_item['summary']:
+                news_item['summary'] = extract_summary(full_content)
+
     async def fetch_full_content(self, url: str, source_config: Dict[str, Any]) -> Optional[str]:
         """获取文章完整内容"""
         try:
-            # 使用与HTML抓取相同的SSL设置
-            connector = aiohttp.TCPConnector(ssl=False)
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=aiohttp.ClientTimeout(total=30),
-                headers={'User-Agent': USER_AGENT}
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        soup = BeautifulSoup(content, 'html.parser')
-                        
-                        # 移除不需要的元素
-                        for unwanted in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', '.sidebar', '.advertisement', '.ads']):
-                            unwanted.decompose()
-                        
-                        # 尝试使用配置的内容选择器
-                        content_selector = source_config['selectors'].get('content')
-                        if content_selector:
-                            content_elem = soup.select_one(content_selector)
-                            if content_elem:
-                                text = clean_text(content_elem.get_text())
-                                if len(text) > 200:
-                                    return text
-                        
-                        # 增强的通用内容提取逻辑
-                        content_selectors = [
-                            # 具体的内容选择器
-                            '.article-content',
-                            '.entry-content', 
-                            '.post-content',
-                            '.content-area',
-                            '.main-content',
-                            '.article-body',
-                            '.post-body',
-                            '.content-wrapper',
-                            # 语义化标签
-                            'article',
-                            'main article',
-                            '.article',
-                            '.post',
-                            # 通用选择器
-                            '.content',
-                            '#content',
-                            '[class*="content"]',
-                            '[class*="article"]',
-                            '[class*="post"]',
-                            # 段落聚合
-                            '.article-text',
-                            '.text-content'
-                        ]
+            # 同一新闻源的文章在同一主机上并发抓取，按主机控制请求间隔
+            await self.rate_limiter.wait(url)
+            async with self.session.get(url, ssl=False) as response:
+                if response.status == 200:
+                    content = await response.text()
+                    soup = make_soup(content)
                         
-                        best_content = ""
-                        max_length = 0
+                    # 优先使用配置的内容选择器
+                    content_selector = source_config['selectors'].get('content')
+                    if content_selector:
+                        content_elem = soup.select_one(content_selector)
+                        if content_elem:
+                            for unwanted in content_elem(UNWANTED_TAGS):
+                                unwanted.decompose()
+                            text = clean_text(content_elem.get_text())
+                            if len(text) > 200:
+                                return text
                         
-                        for selector in content_selectors:
-                            try:
-                                content_elem = soup.select_one(selector)
-                                if content_elem:
-                                    text = clean_text(content_elem.get_text())
-                                    if len(text) > max_length and len(text) > 200:
-                                        max_length = len(text)
-                                        best_content = text
-                            except:
-                                continue
-                        
-                        if best_content:
-                            return best_content
-                        
-                        # 最后尝试：提取所有段落
-                        paragraphs = soup.find_all('p')
-                        if len(paragraphs) > 2:
-                            full_text = '\n\n'.join([clean_text(p.get_text()) for p in paragraphs if len(clean_text(p.get_text())) > 50])
-                            if len(full_text) > 200:
-                                return full_text
+                    # 通用正文提取（方式由 CONTENT_EXTRACTOR 配置）
+                    return extract_content(soup)
                     
         except Exception as e:
             logger.warning(f"Error fetching full content from {url}: {e}")
         
         return None
 
+    async def translate_news_item(self, news_item: Dict[str, Any]) -> None:
+        """翻译新闻条目中的英文标题、摘要和内容（各条目的翻译由翻译器合并为批量请求）"""
+        async def translate_field(field: str) -> None:
+            news_item[f'translated_{field}'] = await translate_text(news_item[field], "ZH")
+        
+        await asyncio.gather(*[
+            translate_field(field)
+            for field in ('title', 'summary', 'content')
+            if news_item.get(field) and is_english(news_item[field])
+        ])
+
     async def generate_ai_summary_for_item(self, news_item: Dict[str, Any]) -> None:
         """为新闻项生成AI概要"""
         try:
@@ -397,26 +534,22 @@ class NewsScraper:
             logger.error(f"Error generating AI summary for {news_item['title']}: {e}")
             news_item['ai_processed'] = False
 
-    async def save_news_item(self, news_item: Dict[str, Any]) -> bool:
-        """保存新闻项"""
-        try:
-            if not validate_news_data(news_item):
-                return False
-            
-            # 检查是否重复
-            if news_item['title'] in self.recent_titles:
-                return False
-            
-            # 保存到数据库
-            news_id = await db.save_news(news_item)
-            if news_id:
-                self.recent_titles.append(news_item['title'])
-                return True
-            
-        except Exception as e:
-            logger.error(f"Error saving news item: {e}")
+    async def save_news_item(self, news_item: Dict[str, Any]) -> Optional[asyncio.Future]:
+        """
+        保存新闻项，返回写入结果的Future（结果为新闻ID），重复或校验不通过时返回None
+
+        写入失败时Future抛出 NewsWriteError，调用方据此区分失败和重复
+        """
+        if not validate_news_data(news_item):
+            return None
         
-        return False
+        # 检查是否重复，并在保存前加入索引，避免并发保存的近似标题同时通过
+        if self.title_index.is_duplicate(news_item['title']):
+            return None
+        self.title_index.add(news_item['title'])
+        
+        # 交给数据库批量写入
+        return await db.save_news(news_item)
 
 async def run_news_scraper():
     """运行新闻爬虫"""
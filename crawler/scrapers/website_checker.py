@@ -1,27 +1,43 @@
 import asyncio
 import aiohttp
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 from loguru import logger
 
 from utils.database import db
+from utils.http_client import http_client
 from utils.helpers import check_website_availability
-from config.settings import USER_AGENT, CRAWL_DELAY
+from config.settings import (
+    WEBSITE_CHECK_CONCURRENCY, WEBSITE_CHECK_PER_HOST,
+    WEBSITE_CHECK_MODE, WEBSITE_CHECK_SAMPLE_BYTES
+)
+
+# 正文少于该长度视为空页面或错误页面
+MIN_BODY_LENGTH = 100
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """计算百分位数（线性插值），无数据时返回None"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
 
 class WebsiteChecker:
     def __init__(self):
         self.session = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': USER_AGENT}
-        )
+        self.session = await http_client.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
-            await self.session.close()
+            await http_client.release()
+            self.session = None
 
     async def check_all_websites(self) -> Dict[str, Any]:
         """检查所有网站的可用性"""
@@ -37,11 +53,24 @@ class WebsiteChecker:
             'errors': []
         }
         
-        for website in websites:
+        # 全局并发上限 + 每个域名的并发上限
+        semaphore = asyncio.Semaphore(WEBSITE_CHECK_CONCURRENCY)
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        response_times: List[float] = []
+        # 检查结果汇总后批量写入数据库，检查过程中不访问数据库
+        statuses: List[Tuple[str, bool, Optional[str]]] = []
+        
+        async def check_one(website: Dict[str, Any]) -> None:
+            host = urlparse(website['url']).netloc.lower()
+            host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(WEBSITE_CHECK_PER_HOST))
+            
             try:
-                logger.info(f"Checking website: {website['name']} - {website['url']}")
+                async with host_semaphore, semaphore:
+                    logger.info(f"Checking website: {website['name']} - {website['url']}")
+                    check_result = await self.check_website(website)
                 
-                check_result = await self.check_website(website)
+                if check_result['response_time'] is not None:
+                    response_times.append(check_result['response_time'])
                 
                 if check_result['available']:
                     results['available'] += 1
@@ -55,15 +84,7 @@ class WebsiteChecker:
                         'error': check_result['error_message']
                     })
                 
-                # 更新数据库中的网站状态
-                await db.update_website_status(
-                    website['id'], 
-                    check_result['available'],
-                    check_result['error_message']
-                )
-                
-                # 添加延迟以避免过于频繁的请求
-                await asyncio.sleep(CRAWL_DELAY)
+                statuses.append((website['id'], check_result['available'], check_result['error_message']))
                 
             except Exception as e:
                 logger.error(f"Error checking website {website['name']}: {e}")
@@ -73,7 +94,18 @@ class WebsiteChecker:
                     'error': str(e)
                 })
         
+        await asyncio.gather(*[check_one(website) for website in websites])
+        
+        # 更新数据库中的网站状态
+        updated_count = await db.update_website_statuses(statuses)
+        logger.info(f"Updated status of {updated_count}/{len(statuses)} websites")
+        
+        results['response_time_p50'] = percentile(response_times, 50)
+        results['response_time_p95'] = percentile(response_times, 95)
+        
         logger.info(f"Website check completed. Available: {results['available']}, Unavailable: {results['unavailable']}")
+        if response_times:
+            logger.info(f"Response time p50: {results['response_time_p50']:.2f}s, p95: {results['response_time_p95']:.2f}s")
         return results
 
     async def check_website(self, website: Dict[str, Any]) -> Dict[str, Any]:
@@ -89,43 +121,37 @@ class WebsiteChecker:
         try:
             start_time = datetime.now()
             
-            async with self.session.get(
-                website['url'],
-                allow_redirects=True,
-                ssl=False  # 对于一些老网站可能需要
-            ) as response:
-                end_time = datetime.now()
-                
-                result['status_code'] = response.status
-                result['response_time'] = (end_time - start_time).total_seconds()
-                result['redirect_url'] = str(response.url) if response.url != website['url'] else None
-                
-                if response.status == 200:
-                    # 检查响应内容
-                    content = await response.text()
-                    
-                    # 基本的内容检查
-                    if len(content) > 100:  # 确保不是空页面
-                        result['available'] = True
-                        logger.debug(f"Website {website['name']} returned valid content")
-                    else:
-                        result['error_message'] = '页面内容过短，可能是错误页面'
-                        
-                elif response.status == 301 or response.status == 302:
+            status, final_url, body_length = await self.probe_website(website['url'])
+            
+            end_time = datetime.now()
+            
+            result['status_code'] = status
+            result['response_time'] = (end_time - start_time).total_seconds()
+            result['redirect_url'] = final_url if final_url != website['url'] else None
+            
+            if status == 200:
+                # 基本的内容检查
+                if body_length > MIN_BODY_LENGTH:  # 确保不是空页面
                     result['available'] = True
-                    result['error_message'] = f'网站重定向到: {result["redirect_url"]}'
-                    
-                elif response.status == 403:
-                    result['error_message'] = '访问被拒绝 (403 Forbidden)'
-                    
-                elif response.status == 404:
-                    result['error_message'] = '页面不存在 (404 Not Found)'
-                    
-                elif response.status == 500:
-                    result['error_message'] = '服务器内部错误 (500 Internal Server Error)'
-                    
+                    logger.debug(f"Website {website['name']} returned valid content")
                 else:
-                    result['error_message'] = f'HTTP状态码: {response.status}'
+                    result['error_message'] = '页面内容过短，可能是错误页面'
+                    
+            elif status == 301 or status == 302:
+                result['available'] = True
+                result['error_message'] = f'网站重定向到: {result["redirect_url"]}'
+                
+            elif status == 403:
+                result['error_message'] = '访问被拒绝 (403 Forbidden)'
+                
+            elif status == 404:
+                result['error_message'] = '页面不存在 (404 Not Found)'
+                
+            elif status == 500:
+                result['error_message'] = '服务器内部错误 (500 Internal Server Error)'
+                
+            else:
+                result['error_message'] = f'HTTP状态码: {status}'
                     
         except aiohttp.ClientError as e:
             result['error_message'] = f'连接错误: {str(e)}'
@@ -138,6 +164,39 @@ class WebsiteChecker:
         
         return result
 
+    async def probe_website(self, url: str) -> Tuple[int, str, int]:
+        """
+        探测网站状态，尽量避免下载完整页面
+        
+        先发送HEAD请求；需要检查正文时改用Range请求只读取前几KB；
+        HEAD返回非2xx/3xx时（很多站点对HEAD处理不当，会返回404、405、500等）
+        退回普通GET（同样只读取前几KB），以GET的结果为准
+        
+        Returns:
+            (状态码, 最终URL, 正文长度)
+        """
+        range_headers = None
+        
+        if WEBSITE_CHECK_MODE == 'head':
+            async with self.session.head(url, allow_redirects=True, ssl=False) as response:
+                if 200 <= response.status < 400:
+                    content_length = response.content_length
+                    if response.status != 200:
+                        return response.status, str(response.url), 0
+                    if content_length is not None and content_length > MIN_BODY_LENGTH:
+                        return response.status, str(response.url), content_length
+                    # 缺少或过短的Content-Length，读取正文开头进行检查
+                    range_headers = {'Range': f'bytes=0-{WEBSITE_CHECK_SAMPLE_BYTES - 1}'}
+        
+        async with self.session.get(url, allow_redirects=True, ssl=False, headers=range_headers) as response:
+            status = response.status
+            if status in (206, 416):  # 部分内容 / 空页面不满足Range
+                status = 200
+            body = b''
+            if status == 200 and response.status != 416:
+                body = await response.content.read(WEBSITE_CHECK_SAMPLE_BYTES)
+            return status, str(response.url), len(body)
+
     async def check_specific_websites(self, website_ids: List[str]) -> Dict[str, Any]:
         """检查指定的网站"""
         logger.info(f"Checking specific websites: {website_ids}")
@@ -11,6 +11,8 @@ from typing import Optional, Dict, Any, List
 from loguru import logger
 from datetime import datetime
 
+from utils.lazy import LazyProxy
+
 class AISummarizer:
     def __init__(self):
         """初始化AI概要生成器"""
@@ -322,7 +324,7 @@ class AISummarizer:
 
 
 # 全局实例
-ai_summarizer = AISummarizer()
+ai_summarizer = LazyProxy(AISummarizer)
 
 async def generate_news_summary(title: str, content: str, source: str = '') -> Optional[Dict[str, Any]]:
     """
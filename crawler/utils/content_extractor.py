@@ -0,0 +1,232 @@
+"""
+文章正文提取
+extract_by_selectors: 原有的选择器级联，按常见正文选择器取最长的文本（默认）
+extract_main_content: 对页面做一次树遍历，把文本切分为段落，按段落文本长度为所在容器打分，
+取得分最高（且链接密度低）的容器中的段落作为正文
+
+单次遍历提取器目前只在合成页面上验证过，在 benchmarks/fixtures/saved 中有保存的真实页面及预期结果之前，
+需通过 CONTENT_EXTRACTOR=density 显式启用
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction
+
+from config.settings import CONTENT_EXTRACTOR
+from utils.helpers import clean_text
+
+# 不包含正文的标签，整棵子树跳过
+SKIP_TAGS = frozenset([
+    'script', 'style', 'noscript', 'template', 'nav', 'header', 'footer', 'aside',
+    'form', 'button', 'select', 'iframe', 'svg', 'canvas', 'head',
+])
+# 自身即为一个段落的标签
+TEXT_BLOCK_TAGS = frozenset([
+    'p', 'pre', 'blockquote', 'li', 'dd', 'dt', 'td', 'th', 'figcaption',
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+])
+# 行内标签，与相邻文本合并为同一段落
+INLINE_TAGS = frozenset([
+    'a', 'abbr', 'b', 'bdi', 'bdo', 'br', 'cite', 'code', 'data', 'dfn', 'em', 'font',
+    'i', 'kbd', 'mark', 'q', 's', 'samp', 'small', 'span', 'strong', 'sub', 'sup',
+    'time', 'u', 'var', 'wbr',
+])
+_IGNORED_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+# class/id 中的提示词，用于调整容器得分
+_NEGATIVE_HINT_RE = re.compile(
+    r'comment|sidebar|widget|advert|\bads?\b|share|social|related|newsletter|promo|'
+    r'breadcrumb|cookie|subscribe|popup|menu', re.I)
+_POSITIVE_HINT_RE = re.compile(r'article|entry|post-?(body|content|text)|story|main-?content|bbwrapper', re.I)
+
+# 选择器级联使用的正文选择器，按顺序尝试，取最长的结果
+CONTENT_SELECTORS = [
+    # 具体的内容选择器
+    '.article-content', '.entry-content', '.post-content', '.content-area', '.main-content',
+    '.article-body', '.post-body', '.content-wrapper',
+    # 语义化标签
+    'article', 'main article', '.article', '.post',
+    # 通用选择器
+    '.content', '#content', '[class*="content"]', '[class*="article"]', '[class*="post"]',
+    # 段落聚合
+    '.article-text', '.text-content',
+]
+# 选择器级联前从页面中移除的元素
+UNWANTED_TAGS = ['script', 'style', 'nav', 'header', 'footer', 'aside']
+
+MIN_BLOCK_LENGTH = 25         # 参与打分的最短段落
+MAX_LINK_DENSITY = 0.5        # 链接文本占比超过该值的段落视为导航
+MIN_CONTENT_LENGTH = 200      # 正文最短长度
+
+_ENTER, _LEAVE, _TEXT = 0, 1, 2
+
+
+class _Candidate:
+    """候选正文容器，start/end 为其包含的段落编号范围"""
+    __slots__ = ('start', 'end', 'score', 'text_length', 'link_length', 'weight')
+
+    def __init__(self, start: int, weight: float):
+        self.start = start
+        self.end = start
+        self.score = 0.0
+        self.text_length = 0
+        self.link_length = 0
+        self.weight = weight
+
+    def final_score(self) -> float:
+        if not self.text_length:
+            return 0.0
+        link_density = self.link_length / self.text_length
+        return self.score * self.weight * (1 - link_density)
+
+
+def _hint_weight(tag: Tag) -> float:
+    """根据 class/id 计算容器权重"""
+    hints = ' '.join(tag.get('class') or []) + ' ' + (tag.get('id') or '')
+    if not hints.strip():
+        return 1.0
+    weight = 1.0
+    if _NEGATIVE_HINT_RE.search(hints):
+        weight *= 0.2
+    if _POSITIVE_HINT_RE.search(hints):
+        weight *= 1.5
+    return weight
+
+
+def _collect_text(nodes, parts: List[str]) -> int:
+    """收集节点下的全部文本，返回其中链接文本的长度"""
+    link_length = 0
+    stack = [(node, False) for node in reversed(nodes)]
+    while stack:
+        node, in_link = stack.pop()
+        if isinstance(node, NavigableString):
+            if not isinstance(node, _IGNORED_STRINGS):
+                parts.append(node)
+                if in_link:
+                    link_length += len(node.strip())
+            continue
+        if node.name in SKIP_TAGS:
+            continue
+        if node.name == 'br':
+            parts.append(' ')
+            continue
+        child_in_link = in_link or node.name == 'a'
+        stack.extend((child, child_in_link) for child in reversed(node.contents))
+    return link_length
+
+
+def extract_main_content(soup: BeautifulSoup) -> Optional[str]:
+    """
+    从页面中提取正文
+
+    整棵树只遍历一次：每个段落只收集、清理一次文本，段落长度累加到其所在的
+    最近两层容器上（上一层减半），最后按链接密度和 class/id 提示修正得分，
+    输出得分最高的容器中的所有段落。结果只取决于页面内容，是确定性的。
+
+    Returns:
+        以空行分隔的正文段落，找不到足够长的正文时返回None
+    """
+    root = soup.body or soup
+    blocks: List[tuple] = []  # (文本, 链接文本长度)
+    candidates: Dict[int, _Candidate] = {}
+    containers: List[_Candidate] = []
+
+    stack: list = [(_ENTER, root)]
+    while stack:
+        action, node = stack.pop()
+
+        if action == _LEAVE:
+            containers.pop().end = len(blocks)
+            continue
+
+        if action == _TEXT:
+            parts: List[str] = []
+            link_length = _collect_text(node, parts)
+            text = clean_text(''.join(parts))
+            if not text:
+                continue
+            blocks.append((text, link_length))
+            if len(text) < MIN_BLOCK_LENGTH or link_length > len(text) * MAX_LINK_DENSITY:
+                continue
+            for depth, container in enumerate(reversed(containers[-2:])):
+                container.score += len(text) / (depth + 1)
+            for container in containers:
+                container.text_length += len(text)
+                container.link_length += link_length
+            continue
+
+        candidate = _Candidate(len(blocks), _hint_weight(node))
+        candidates[id(node)] = candidate
+        containers.append(candidate)
+
+        # 相邻的文本和行内元素合并为一个段落，块级子元素继续遍历
+        children = []
+        inline_run = []
+        for child in node.contents:
+            if isinstance(child, NavigableString) or child.name in INLINE_TAGS:
+                inline_run.append(child)
+                continue
+            if inline_run:
+                children.append((_TEXT, inline_run))
+                inline_run = []
+            if child.name in SKIP_TAGS:
+                continue
+            children.append((_TEXT, [child]) if child.name in TEXT_BLOCK_TAGS else (_ENTER, child))
+        if inline_run:
+            children.append((_TEXT, inline_run))
+
+        stack.append((_LEAVE, node))
+        stack.extend(reversed(children))
+
+    best = max(candidates.values(), key=_Candidate.final_score, default=None)
+    if best is None or best.score <= 0:
+        return None
+
+    paragraphs = [
+        text for text, link_length in blocks[best.start:best.end]
+        if link_length <= len(text) * MAX_LINK_DENSITY
+    ]
+    content = '\n\n'.join(paragraphs)
+    if len(content) < MIN_CONTENT_LENGTH:
+        return None
+    return content
+
+
+def extract_by_selectors(soup: BeautifulSoup) -> Optional[str]:
+    """
+    按常见正文选择器提取正文（原有逻辑，会修改 soup）
+
+    Returns:
+        最长的匹配文本；都不够长时退回到聚合所有较长段落，仍找不到时返回None
+    """
+    for unwanted in soup(UNWANTED_TAGS):
+        unwanted.decompose()
+
+    best_content = ""
+    max_length = 0
+    for selector in CONTENT_SELECTORS:
+        content_elem = soup.select_one(selector)
+        if content_elem:
+            text = clean_text(content_elem.get_text())
+            if len(text) > max_length and len(text) > MIN_CONTENT_LENGTH:
+                max_length = len(text)
+                best_content = text
+    if best_content:
+        return best_content
+
+    # 最后尝试：提取所有段落
+    paragraphs = soup.find_all('p')
+    if len(paragraphs) > 2:
+        full_text = '\n\n'.join([clean_text(p.get_text()) for p in paragraphs if len(clean_text(p.get_text())) > 50])
+        if len(full_text) > MIN_CONTENT_LENGTH:
+            return full_text
+    return None
+
+
+def extract_content(soup: BeautifulSoup) -> Optional[str]:
+    """按 CONTENT_EXTRACTOR 配置选择正文提取方式"""
+    if CONTENT_EXTRACTOR == 'density':
+        return extract_main_content(soup)
+    return extract_by_selectors(soup)
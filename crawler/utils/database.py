@@ -1,60 +1,162 @@
-try:
-    from supabase import create_client, Client
-except ImportError:
-    print("Please install supabase client: pip install supabase")
-    exit(1)
 from loguru import logger
-from config.settings import SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY
-from typing import Dict, List, Optional, Any
+from config.settings import (
+    SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY, DB_PAGE_SIZE, DB_DELETE_BATCH_SIZE, DUPLICATE_THRESHOLD_DAYS
+)
+from typing import Dict, List, Optional, Any, Iterator, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
-import hashlib
 import asyncio
 
+from utils.dedup import NewsDedupIndex, generate_news_hash
+from utils.news_writer import NewsWriter
+from utils.lazy import LazyProxy
+
+if TYPE_CHECKING:
+    from supabase import Client
+
 class DatabaseManager:
     def __init__(self):
         if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE_KEY:
             raise ValueError("Missing Supabase configuration")
         
-        self.client: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        # supabase 导入较慢，在首次使用数据库时才导入
+        try:
+            from supabase import create_client
+        except ImportError:
+            print("Please install supabase client: pip install supabase")
+            exit(1)
+        
+        self.client: 'Client' = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
+        self.dedup_index: Optional[NewsDedupIndex] = None
+        self.news_writer = NewsWriter(self.client)
         logger.info("Database connection initialized")
 
     def _generate_content_hash(self, title: str, url: str = None) -> str:
         """生成内容哈希值用于去重"""
-        content = title.lower().strip()
-        if url:
-            content += url.lower().strip()
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+        return generate_news_hash(title, url)
+
+    def _iter_rows(self, table: str, columns: str, page_size: int = DB_PAGE_SIZE,
+                   created_since: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """按主键分页遍历整张表（指定 created_since 时只遍历该时间之后创建的记录）"""
+        last_id = None
+        while True:
+            query = self.client.table(table).select(columns).order('id').limit(page_size)
+            if created_since is not None:
+                query = query.gte('created_at', created_since)
+            if last_id is not None:
+                query = query.gt('id', last_id)
+            rows = query.execute().data or []
+            yield from rows
+            if len(rows) < page_size:
+                break
+            last_id = rows[-1]['id']
+
+    def _iter_rows_by_created_at(self, table: str, columns: str, page_size: int = DB_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """按 (created_at, id) 键集分页遍历整张表，最早创建的记录在前"""
+        cursor = None
+        while True:
+            rows = []
+            if cursor is not None:
+                # 先取与上一页最后一行创建时间相同的剩余记录
+                rows = self.client.table(table).select(columns).eq('created_at', cursor[0]) \
+                    .gt('id', cursor[1]).order('id').limit(page_size).execute().data or []
+            
+            if not rows:
+                query = self.client.table(table).select(columns).order('created_at,id').limit(page_size)
+                if cursor is not None:
+                    query = query.gt('created_at', cursor[0])
+                rows = query.execute().data or []
+                if not rows:
+                    break
+            
+            yield from rows
+            cursor = (rows[-1]['created_at'], rows[-1]['id'])
+
+    def _delete_by_ids(self, table: str, ids: List[str]) -> int:
+        """按ID批量删除，返回删除数量"""
+        if not ids:
+            return 0
+        try:
+            result = self.client.table(table).delete().in_('id', ids).execute()
+            return len(result.data or [])
+        except Exception as e:
+            logger.error(f"Error deleting {len(ids)} rows from {table}: {e}")
+            return 0
+
+    @staticmethod
+    async def _execute(query):
+        """执行查询；Supabase客户端是同步的，请求放到线程中执行，避免阻塞事件循环"""
+        return await asyncio.to_thread(query.execute)
+
+    def _find_news_id_by_title(self, title: str) -> Optional[str]:
+        """按标题精确查找已有新闻（news.title 上有索引），返回新闻ID"""
+        result = self.client.table('news').select('id').eq('title', title).limit(1).execute()
+        return result.data[0]['id'] if result.data else None
+
+    async def load_dedup_index(self, max_age: Optional[float] = None,
+                               days: int = DUPLICATE_THRESHOLD_DAYS) -> NewsDedupIndex:
+        """
+        从数据库加载新闻去重索引
+
+        只加载最近 days 天创建的新闻，加载成本不随表大小增长。更早的新闻不在索引中：
+        save_news 对索引未命中的标题再按 title 索引精确查询一次，URL重复由 original_url 唯一索引在写入时忽略，
+        只有内容哈希重复限于该时间窗口（与原先的检查一致）
+
+        Args:
+            max_age: 已加载的索引在该秒数内时直接复用（常驻调度器中多次运行共享同一索引）
+            days: 加载的时间窗口（天）
+        """
+        if max_age is not None and self.dedup_index is not None and self.dedup_index.loaded_at:
+            age = (datetime.now() - self.dedup_index.loaded_at).total_seconds()
+            if age < max_age:
+                logger.info(f"Reusing news dedup index with {len(self.dedup_index)} entries ({age:.0f}s old)")
+                return self.dedup_index
+        
+        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        
+        def build_index() -> NewsDedupIndex:
+            index = NewsDedupIndex()
+            for row in self._iter_rows('news', 'id, title, original_url', created_since=cutoff_date):
+                index.add(row['id'], row['title'], row['original_url'])
+            return index
+        
+        # Supabase客户端是同步的，分页查询放到线程中执行，避免阻塞事件循环
+        index = await asyncio.to_thread(build_index)
+        index.loaded_at = datetime.now()
+        self.dedup_index = index
+        logger.info(f"Loaded news dedup index with {len(index)} entries from the last {days} days")
+        return index
 
     async def clean_duplicate_news(self) -> int:
         """清理重复的新闻数据"""
         try:
             logger.info("Starting duplicate news cleanup...")
             
-            # 获取所有新闻，按创建时间排序
-            result = self.client.table('news').select('id, title, original_url, created_at').order('created_at', desc=False).execute()
-            all_news = result.data or []
-            
-            seen_hashes = set()
-            duplicates_to_delete = []
-            
-            for news in all_news:
-                content_hash = self._generate_content_hash(news['title'], news['original_url'])
+            # 按创建时间分页遍历所有新闻，保留最早的一条，重复项按批删除
+            def clean() -> int:
+                seen_hashes = set()
+                duplicates_to_delete = []
+                deleted_count = 0
                 
-                if content_hash in seen_hashes:
-                    duplicates_to_delete.append(news['id'])
-                    logger.info(f"Found duplicate: {news['title']}")
-                else:
-                    seen_hashes.add(content_hash)
+                for news in self._iter_rows_by_created_at('news', 'id, title, original_url, created_at'):
+                    content_hash = self._generate_content_hash(news['title'], news['original_url'])
+                    
+                    if content_hash in seen_hashes:
+                        duplicates_to_delete.append(news['id'])
+                        logger.info(f"Found duplicate: {news['title']}")
+                        if len(duplicates_to_delete) >= DB_DELETE_BATCH_SIZE:
+                            deleted_count += self._delete_by_ids('news', duplicates_to_delete)
+                            duplicates_to_delete = []
+                    else:
+                        seen_hashes.add(content_hash)
+                
+                return deleted_count + self._delete_by_ids('news', duplicates_to_delete)
             
-            # 删除重复项
-            deleted_count = 0
-            for news_id in duplicates_to_delete:
-                try:
-                    delete_result = self.client.table('news').delete().eq('id', news_id).execute()
-                    if delete_result.data:
-                        deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Error deleting duplicate news {news_id}: {e}")
+            # 遍历整张表耗时较长，放到线程中执行，避免阻塞同一事件循环上的其他任务
+            deleted_count = await asyncio.to_thread(clean)
+            
+            # 删除过新闻后，已加载的去重索引中可能有失效的ID，下次使用时重新加载
+            if deleted_count:
+                self.dedup_index = None
             
             logger.success(f"Cleaned {deleted_count} duplicate news items")
             return deleted_count
@@ -68,31 +170,27 @@ class DatabaseManager:
         try:
             logger.info("Starting duplicate websites cleanup...")
             
-            # 获取所有网站，按创建时间排序
-            result = self.client.table('websites').select('id, name, url, created_at').order('created_at', desc=False).execute()
-            all_websites = result.data or []
-            
-            seen_urls = set()
-            duplicates_to_delete = []
-            
-            for website in all_websites:
-                url_normalized = website['url'].lower().strip().rstrip('/')
+            # 按创建时间分页遍历所有网站，保留最早的一条，重复项按批删除
+            def clean() -> int:
+                seen_urls = set()
+                duplicates_to_delete = []
+                deleted_count = 0
                 
-                if url_normalized in seen_urls:
-                    duplicates_to_delete.append(website['id'])
-                    logger.info(f"Found duplicate website: {website['name']} - {website['url']}")
-                else:
-                    seen_urls.add(url_normalized)
+                for website in self._iter_rows_by_created_at('websites', 'id, name, url, created_at'):
+                    url_normalized = website['url'].lower().strip().rstrip('/')
+                    
+                    if url_normalized in seen_urls:
+                        duplicates_to_delete.append(website['id'])
+                        logger.info(f"Found duplicate website: {website['name']} - {website['url']}")
+                        if len(duplicates_to_delete) >= DB_DELETE_BATCH_SIZE:
+                            deleted_count += self._delete_by_ids('websites', duplicates_to_delete)
+                            duplicates_to_delete = []
+                    else:
+                        seen_urls.add(url_normalized)
+                
+                return deleted_count + self._delete_by_ids('websites', duplicates_to_delete)
             
-            # 删除重复项
-            deleted_count = 0
-            for website_id in duplicates_to_delete:
-                try:
-                    delete_result = self.client.table('websites').delete().eq('id', website_id).execute()
-                    if delete_result.data:
-                        deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Error deleting duplicate website {website_id}: {e}")
+            deleted_count = await asyncio.to_thread(clean)
             
             logger.success(f"Cleaned {deleted_count} duplicate websites")
             return deleted_count
@@ -101,69 +199,97 @@ class DatabaseManager:
             logger.error(f"Error cleaning duplicate websites: {e}")
             return 0
 
-    async def save_news(self, news_data: Dict[str, Any]) -> Optional[str]:
-        """保存新闻数据，增强去重逻辑"""
-        try:
-            # 标准化标题和URL
-            title = news_data['title'].strip()
-            url = news_data['original_url'].strip()
-            
-            # 检查是否已存在相同标题的新闻（精确匹配）
-            existing_title = self.client.table('news').select('id').eq('title', title).execute()
-            if existing_title.data:
-                logger.info(f"News with same title already exists: {title}")
-                return existing_title.data[0]['id']
-
-            # 检查是否已存在相同URL的新闻
-            existing_url = self.client.table('news').select('id').eq('original_url', url).execute()
-            if existing_url.data:
-                logger.info(f"News with same URL already exists: {url}")
-                return existing_url.data[0]['id']
+    async def save_news(self, news_data: Dict[str, Any]) -> Optional[asyncio.Future]:
+        """
+        保存新闻数据，增强去重逻辑
 
-            # 检查内容相似度（使用哈希值）
-            content_hash = self._generate_content_hash(title, url)
-            
-            # 检查最近7天是否有相似内容
-            cutoff_date = (datetime.now() - timedelta(days=7)).isoformat()
-            recent_news = self.client.table('news').select('title, original_url').gte('created_at', cutoff_date).execute()
-            
-            for existing in recent_news.data or []:
-                existing_hash = self._generate_content_hash(existing['title'], existing['original_url'])
-                if existing_hash == content_hash:
-                    logger.info(f"Similar news content already exists: {title}")
-                    return None
+        新闻交给批量写入器后立即返回，不等待写入完成；调用方在运行结束时等待返回的Future
 
-            # 添加创建时间
-            news_data['created_at'] = datetime.now().isoformat()
-            news_data['crawled_at'] = datetime.now().isoformat()
+        Returns:
+            重复时返回None，否则返回写入结果的Future：结果为新闻ID，original_url 已存在而被忽略时为None，
+            写入失败时抛出 NewsWriteError
+        """
+        # 标准化标题和URL
+        title = news_data['title'].strip()
+        url = news_data['original_url'].strip()
+        
+        # 使用本地去重索引判断标题、URL和内容哈希是否重复
+        if self.dedup_index is None:
+            await self.load_dedup_index()
+        dedup_index = self.dedup_index
+        
+        reason, _ = dedup_index.find_duplicate(title, url)
+        if reason == 'title':
+            logger.info(f"News with same title already exists: {title}")
+            return None
+        if reason == 'url':
+            logger.info(f"News with same URL already exists: {url}")
+            return None
+        if reason == 'hash':
+            logger.info(f"Similar news content already exists: {title}")
+            return None
 
-            # 准备要插入的数据
-            cleaned_data = news_data.copy()
-            
-            # 确保翻译字段存在，即使为空
-            cleaned_data['translated_title'] = news_data.get('translated_title')
-            cleaned_data['translated_summary'] = news_data.get('translated_summary')
-            cleaned_data['translated_content'] = news_data.get('translated_content')
+        # 添加创建时间
+        news_data['created_at'] = datetime.now().isoformat()
+        news_data['crawled_at'] = datetime.now().isoformat()
 
-            # 临时移除AI字段（如果数据库表还没有这些字段）
-            ai_fields = ['ai_summary', 'ai_processed', 'ai_keywords', 'ai_processed_at']
-            for field in ai_fields:
-                cleaned_data.pop(field, None)
-            
-            # 插入新闻
-            result = self.client.table('news').insert(cleaned_data).execute()
-            
-            if result.data:
-                news_id = result.data[0]['id']
+        # 准备要插入的数据
+        cleaned_data = news_data.copy()
+        
+        # 确保翻译字段存在，即使为空
+        cleaned_data['translated_title'] = news_data.get('translated_title')
+        cleaned_data['translated_summary'] = news_data.get('translated_summary')
+        cleaned_data['translated_content'] = news_data.get('translated_content')
+
+        # 临时移除AI字段（如果数据库表还没有这些字段）
+        ai_fields = ['ai_summary', 'ai_processed', 'ai_keywords', 'ai_processed_at']
+        for field in ai_fields:
+            cleaned_data.pop(field, None)
+        
+        # 先占位加入去重索引，避免同一批次中的重复新闻在写入前通过检查
+        dedup_index.add(None, title, url)
+        
+        # 索引只覆盖最近的新闻，更早的同标题新闻按标题索引查询（在线程中执行，不阻塞事件循环）
+        try:
+            existing_id = await asyncio.to_thread(self._find_news_id_by_title, title)
+        except Exception:
+            dedup_index.discard(title, url)
+            raise
+        if existing_id:
+            dedup_index.add(existing_id, title, url)
+            logger.info(f"News with same title already exists: {title}")
+            return None
+        
+        def on_written(future: asyncio.Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                dedup_index.discard(title, url)
+                logger.error(f"Failed to save news: {title}")
+            elif future.result():
+                dedup_index.add(future.result(), title, url)
                 logger.success(f"News saved: {title}")
-                return news_id
             else:
-                logger.error(f"Failed to save news: {title}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error saving news: {e}")
-            return None
+                # 去重索引只覆盖最近的新闻，更早的同URL新闻由 original_url 唯一索引忽略
+                logger.info(f"News with same URL already exists: {url}")
+        
+        # 交给批量写入器，按批次 upsert
+        future = self.news_writer.enqueue(cleaned_data)
+        future.add_done_callback(on_written)
+        return future
+
+    def get_dedup_titles(self) -> List[str]:
+        """返回已加载的去重索引中的新闻标题（用于构建近似重复索引），索引未加载时返回空列表"""
+        return self.dedup_index.get_titles() if self.dedup_index is not None else []
+
+    def is_known_news(self, title: str, url: str) -> bool:
+        """按已加载的去重索引检查标题、URL或内容哈希是否已存在（只查内存，不访问数据库）"""
+        if self.dedup_index is None:
+            return False
+        reason, _ = self.dedup_index.find_duplicate(title.strip(), url.strip())
+        return reason is not None
+
+    async def flush_news(self) -> None:
+        """写入批量写入器中缓冲的所有新闻"""
+        await self.news_writer.close()
 
     async def save_website(self, website_data: Dict[str, Any]) -> Optional[str]:
         """保存网站数据，增强去重逻辑"""
@@ -173,14 +299,14 @@ class DatabaseManager:
             name = website_data['name'].strip()
             
             # 检查是否已存在相同URL的网站（标准化后比较）
-            existing = self.client.table('websites').select('id, url').execute()
+            existing = await self._execute(self.client.table('websites').select('id, url'))
             for item in existing.data or []:
                 if item['url'].strip().rstrip('/').lower() == url.lower():
                     logger.info(f"Website with same URL already exists: {url}")
                     return item['id']
 
             # 检查是否已存在相同名称的网站
-            existing_name = self.client.table('websites').select('id').ilike('name', f'%{name}%').execute()
+            existing_name = await self._execute(self.client.table('websites').select('id').ilike('name', f'%{name}%'))
             if existing_name.data:
                 logger.info(f"Website with similar name already exists: {name}")
                 return existing_name.data[0]['id']
@@ -189,7 +315,7 @@ class DatabaseManager:
             website_data['created_at'] = datetime.now().isoformat()
 
             # 插入网站
-            result = self.client.table('websites').insert(website_data).execute()
+            result = await self._execute(self.client.table('websites').insert(website_data))
             
             if result.data:
                 website_id = result.data[0]['id']
@@ -206,7 +332,7 @@ class DatabaseManager:
     async def get_categories(self) -> List[Dict[str, Any]]:
         """获取所有分类"""
         try:
-            result = self.client.table('categories').select('*').eq('is_active', True).execute()
+            result = await self._execute(self.client.table('categories').select('*').eq('is_active', True))
             return result.data or []
         except Exception as e:
             logger.error(f"Error getting categories: {e}")
@@ -215,7 +341,7 @@ class DatabaseManager:
     async def get_category_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """根据名称获取分类"""
         try:
-            result = self.client.table('categories').select('*').eq('name', name).single().execute()
+            result = await self._execute(self.client.table('categories').select('*').eq('name', name).single())
             return result.data
         except Exception as e:
             logger.error(f"Error getting category by name {name}: {e}")
@@ -228,18 +354,45 @@ class DatabaseManager:
             if error_message:
                 update_data['admin_notes'] = error_message
                 
-            result = self.client.table('websites').update(update_data).eq('id', website_id).execute()
+            result = await self._execute(self.client.table('websites').update(update_data).eq('id', website_id))
             return bool(result.data)
         except Exception as e:
             logger.error(f"Error updating website status: {e}")
             return False
 
+    async def update_website_statuses(self, statuses: List[Tuple[str, bool, Optional[str]]]) -> int:
+        """
+        批量更新网站状态，状态和错误信息相同的网站合并为一次请求
+
+        Args:
+            statuses: (网站ID, 是否可用, 错误信息) 列表
+
+        Returns:
+            更新的网站数量
+        """
+        groups: Dict[Tuple[bool, Optional[str]], List[str]] = {}
+        for website_id, is_active, error_message in statuses:
+            groups.setdefault((is_active, error_message or None), []).append(website_id)
+        
+        updated_at = datetime.now().isoformat()
+        updated_count = 0
+        for (is_active, error_message), ids in groups.items():
+            update_data = {'is_active': is_active, 'updated_at': updated_at}
+            if error_message:
+                update_data['admin_notes'] = error_message
+            try:
+                result = await self._execute(self.client.table('websites').update(update_data).in_('id', ids))
+                updated_count += len(result.data or [])
+            except Exception as e:
+                logger.error(f"Error updating status of {len(ids)} websites: {e}")
+        return updated_count
+
     async def get_recent_news_titles(self, days: int = 7) -> List[str]:
         """获取最近几天的新闻标题，用于去重"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            result = self.client.table('news').select('title').gte('created_at', cutoff_date).execute()
+            result = await self._execute(self.client.table('news').select('title').gte('created_at', cutoff_date))
             return [item['title'] for item in result.data or []]
         except Exception as e:
             logger.error(f"Error getting recent news titles: {e}")
@@ -248,7 +401,7 @@ class DatabaseManager:
     async def get_websites_for_check(self) -> List[Dict[str, Any]]:
         """获取需要检查的网站列表"""
         try:
-            result = self.client.table('websites').select('id, name, url').eq('is_active', True).execute()
+            result = await self._execute(self.client.table('websites').select('id, name, url').eq('is_active', True))
             return result.data or []
         except Exception as e:
             logger.error(f"Error getting websites for check: {e}")
@@ -262,7 +415,7 @@ class DatabaseManager:
             # 获取各表的记录数
             for table in ['categories', 'websites', 'news', 'wechat_accounts', 'user_feedback']:
                 try:
-                    result = self.client.table(table).select('id', count='exact').execute()
+                    result = await self._execute(self.client.table(table).select('id', count='exact'))
                     stats[table] = result.count or 0
                 except:
                     stats[table] = 0
@@ -292,7 +445,7 @@ class DatabaseManager:
     async def delete_website(self, website_id: str) -> bool:
         """删除指定的网站"""
         try:
-            result = self.client.table('websites').delete().eq('id', website_id).execute()
+            result = await self._execute(self.client.table('websites').delete().eq('id', website_id))
             if result.data:
                 logger.success(f"Website deleted successfully: {website_id}")
                 return True
@@ -341,14 +494,14 @@ class DatabaseManager:
             wechat_id = wechat_data.get('wechat_id', '').strip()
             
             # 检查是否已存在相同名称的公众号
-            existing_name = self.client.table('wechat_accounts').select('id').eq('name', name).execute()
+            existing_name = await self._execute(self.client.table('wechat_accounts').select('id').eq('name', name))
             if existing_name.data:
                 logger.info(f"WeChat account with same name already exists: {name}")
                 return existing_name.data[0]['id']
 
             # 检查是否已存在相同微信号的公众号
             if wechat_id:
-                existing_id = self.client.table('wechat_accounts').select('id').eq('wechat_id', wechat_id).execute()
+                existing_id = await self._execute(self.client.table('wechat_accounts').select('id').eq('wechat_id', wechat_id))
                 if existing_id.data:
                     logger.info(f"WeChat account with same wechat_id already exists: {wechat_id}")
                     return existing_id.data[0]['id']
@@ -358,7 +511,7 @@ class DatabaseManager:
             wechat_data['updated_at'] = datetime.now().isoformat()
 
             # 插入微信公众号
-            result = self.client.table('wechat_accounts').insert(wechat_data).execute()
+            result = await self._execute(self.client.table('wechat_accounts').insert(wechat_data))
             
             if result.data:
                 account_id = result.data[0]['id']
@@ -376,13 +529,13 @@ class DatabaseManager:
         """检查微信公众号是否已存在"""
         try:
             # 检查名称
-            existing_name = self.client.table('wechat_accounts').select('id').eq('name', name).execute()
+            existing_name = await self._execute(self.client.table('wechat_accounts').select('id').eq('name', name))
             if existing_name.data:
                 return True
             
             # 检查微信号
             if wechat_id:
-                existing_id = self.client.table('wechat_accounts').select('id').eq('wechat_id', wechat_id).execute()
+                existing_id = await self._execute(self.client.table('wechat_accounts').select('id').eq('wechat_id', wechat_id))
                 if existing_id.data:
                     return True
             
@@ -394,7 +547,7 @@ class DatabaseManager:
     async def get_wechat_accounts(self, limit: int = 50) -> List[Dict[str, Any]]:
         """获取微信公众号列表"""
         try:
-            result = self.client.table('wechat_accounts').select('*').limit(limit).execute()
+            result = await self._execute(self.client.table('wechat_accounts').select('*').limit(limit))
             return result.data or []
         except Exception as e:
             logger.error(f"Error getting WeChat accounts: {e}")
@@ -412,7 +565,7 @@ class DatabaseManager:
             if ai_keywords:
                 update_data['ai_keywords'] = ai_keywords
             
-            result = self.client.table('news').update(update_data).eq('id', news_id).execute()
+            result = await self._execute(self.client.table('news').update(update_data).eq('id', news_id))
             
             if result.data:
                 logger.success(f"AI summary updated for news ID: {news_id}")
@@ -428,7 +581,7 @@ class DatabaseManager:
     async def get_news_without_ai_summary(self, limit: int = 10) -> List[Dict[str, Any]]:
         """获取未生成AI概要的新闻"""
         try:
-            result = self.client.table('news').select('id, title, summary, content, source').eq('ai_processed', False).limit(limit).execute()
+            result = await self._execute(self.client.table('news').select('id, title, summary, content, source').eq('ai_processed', False).limit(limit))
             return result.data or []
         except Exception as e:
             logger.error(f"Error getting news without AI summary: {e}")
@@ -487,46 +640,42 @@ class DatabaseManager:
         try:
             logger.info("Starting duplicate WeChat accounts cleanup...")
             
-            # 获取所有微信公众号，按创建时间排序
-            result = self.client.table('wechat_accounts').select('id, name, wechat_id, created_at').order('created_at', desc=False).execute()
-            all_accounts = result.data or []
-            
-            seen_names = set()
-            seen_wechat_ids = set()
-            duplicates_to_delete = []
-            
-            for account in all_accounts:
-                name = account['name'].lower().strip()
-                wechat_id = account.get('wechat_id', '').lower().strip()
+            # 按创建时间分页遍历所有微信公众号，保留最早的一条，重复项按批删除
+            def clean() -> int:
+                seen_names = set()
+                seen_wechat_ids = set()
+                duplicates_to_delete = []
+                deleted_count = 0
                 
-                is_duplicate = False
+                for account in self._iter_rows_by_created_at('wechat_accounts', 'id, name, wechat_id, created_at'):
+                    name = account['name'].lower().strip()
+                    wechat_id = (account.get('wechat_id') or '').lower().strip()
                 
-                # 检查名称重复
-                if name in seen_names:
-                    is_duplicate = True
-                    logger.info(f"Found duplicate WeChat account by name: {account['name']}")
+                    is_duplicate = False
                 
-                # 检查微信号重复
-                if wechat_id and wechat_id in seen_wechat_ids:
-                    is_duplicate = True
-                    logger.info(f"Found duplicate WeChat account by wechat_id: {account['name']} ({wechat_id})")
+                    # 检查名称重复
+                    if name in seen_names:
+                        is_duplicate = True
+                        logger.info(f"Found duplicate WeChat account by name: {account['name']}")
                 
-                if is_duplicate:
-                    duplicates_to_delete.append(account['id'])
-                else:
-                    seen_names.add(name)
-                    if wechat_id:
-                        seen_wechat_ids.add(wechat_id)
-            
-            # 删除重复项
-            deleted_count = 0
-            for account_id in duplicates_to_delete:
-                try:
-                    delete_result = self.client.table('wechat_accounts').delete().eq('id', account_id).execute()
-                    if delete_result.data:
-                        deleted_count += 1
-                except Exception as e:
-                    logger.error(f"Error deleting duplicate WeChat account {account_id}: {e}")
+                    # 检查微信号重复
+                    if wechat_id and wechat_id in seen_wechat_ids:
+                        is_duplicate = True
+                        logger.info(f"Found duplicate WeChat account by wechat_id: {account['name']} ({wechat_id})")
+                
+                    if is_duplicate:
+                        duplicates_to_delete.append(account['id'])
+                        if len(duplicates_to_delete) >= DB_DELETE_BATCH_SIZE:
+                            deleted_count += self._delete_by_ids('wechat_accounts', duplicates_to_delete)
+                            duplicates_to_delete = []
+                    else:
+                        seen_names.add(name)
+                        if wechat_id:
+                            seen_wechat_ids.add(wechat_id)
+                
+                return deleted_count + self._delete_by_ids('wechat_accounts', duplicates_to_delete)
+                
+            deleted_count = await asyncio.to_thread(clean)
             
             logger.success(f"Cleaned {deleted_count} duplicate WeChat accounts")
             return deleted_count
@@ -535,4 +684,5 @@ class DatabaseManager:
             logger.error(f"Error cleaning duplicate WeChat accounts: {e}")
             return 0
 
-db = DatabaseManager()
\ No newline at end of file
+# 全局实例，首次使用时才建立连接
+db = LazyProxy(DatabaseManager)
\ No newline at end of file
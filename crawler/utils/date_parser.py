@@ -0,0 +1,181 @@
+"""
+日期解析
+支持 RFC-822（RSS pubDate）、ISO-8601、常见数字格式、中文和英文月份格式，
+按来源记住上次命中的格式，并统计每个来源的解析失败次数
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+_RFC822_RE = re.compile(r'^\s*(?:[A-Za-z]{3},?\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}')
+# 整串为ISO-8601日期或日期时间（分隔符为T或空格），交给C实现的 datetime.fromisoformat 解析
+_ISO8601_RE = re.compile(
+    r'\s*\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}(?::?\d{2})?)?)?\s*')
+# 整串格式（RFC-822、ISO-8601）都以数字或“三字母星期+数字”开头，不满足该前缀的字符串只可能是搜索格式
+_EXACT_PREFIX_RE = re.compile(r'\s*(?:\d|[A-Za-z]{3},?\s*\d)')
+_NUMERIC_RE = re.compile(
+    r'(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})(?!\d)(?:[ T]+(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?')
+_CHINESE_RE = re.compile(r'(\d{4})年(\d{1,2})月(\d{1,2})日(?:\s*(\d{1,2})[:：](\d{1,2})(?:[:：](\d{1,2}))?)?')
+_CHINESE_MONTH_DAY_RE = re.compile(r'(?<!\d)(?<!年)(\d{1,2})月(\d{1,2})日')
+_ENGLISH_RE = re.compile(r'\b([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})\b')
+
+_MONTHS = {
+    name: index + 1
+    for index, names in enumerate([
+        ('jan', 'january'), ('feb', 'february'), ('mar', 'march'), ('apr', 'april'),
+        ('may',), ('jun', 'june'), ('jul', 'july'), ('aug', 'august'),
+        ('sep', 'sept', 'september'), ('oct', 'october'), ('nov', 'november'), ('dec', 'december'),
+    ])
+    for name in names
+}
+
+_UTC = timezone.utc
+
+
+def _utc(dt: datetime) -> datetime:
+    """没有时区信息的时间按UTC处理"""
+    if dt.tzinfo is None:
+        # combine 比 replace(tzinfo=...) 快数倍
+        return datetime.combine(dt.date(), dt.time(), _UTC)
+    return dt
+
+
+def _from_groups(groups) -> datetime:
+    year, month, day, hour, minute, second = groups
+    # 时区按位置参数传入，比关键字参数快
+    return datetime(int(year), int(month), int(day),
+                    int(hour) if hour else 0, int(minute) if minute else 0, int(second) if second else 0, 0, _UTC)
+
+
+def _parse_rfc822(date_str: str) -> Optional[datetime]:
+    if not _RFC822_RE.match(date_str):
+        return None
+    return _utc(parsedate_to_datetime(date_str.strip()))
+
+
+def _parse_iso8601(date_str: str) -> Optional[datetime]:
+    if not _ISO8601_RE.fullmatch(date_str):
+        return None
+    return _utc(datetime.fromisoformat(date_str.strip().replace('Z', '+00:00')))
+
+
+def _parse_numeric(date_str: str) -> Optional[datetime]:
+    match = _NUMERIC_RE.search(date_str)
+    return _from_groups(match.groups()) if match else None
+
+
+def _parse_chinese(date_str: str) -> Optional[datetime]:
+    match = _CHINESE_RE.search(date_str)
+    return _from_groups(match.groups()) if match else None
+
+
+def _parse_chinese_month_day(date_str: str) -> Optional[datetime]:
+    match = _CHINESE_MONTH_DAY_RE.search(date_str)
+    if not match:
+        return None
+    now = datetime.now(_UTC)
+    dt = datetime(now.year, int(match.group(1)), int(match.group(2)), 0, 0, 0, 0, _UTC)
+    # 没有年份时取当前年份，落在未来则视为去年
+    if dt > now + timedelta(days=1):
+        dt = dt.replace(year=now.year - 1)
+    return dt
+
+
+def _parse_english(date_str: str) -> Optional[datetime]:
+    match = _ENGLISH_RE.search(date_str)
+    if not match:
+        return None
+    month = _MONTHS.get(match.group(1).lower())
+    if not month:
+        return None
+    return datetime(int(match.group(3)), month, int(match.group(2)), 0, 0, 0, 0, _UTC)
+
+
+# 按尝试顺序排列：(名称, 解析函数, 是否必须匹配整个字符串)
+# 整串格式在前，在文本中搜索的格式在后；搜索格式可能只匹配到整串格式的一部分
+# （如 numeric 能从带时区的ISO时间中匹配出不含时区的日期），因此必须排在整串格式之后尝试
+DATE_FORMATS: List[Tuple[str, Callable[[str], Optional[datetime]], bool]] = [
+    ('rfc822', _parse_rfc822, True),
+    ('iso8601', _parse_iso8601, True),
+    ('numeric', _parse_numeric, False),
+    ('chinese', _parse_chinese, False),
+    ('chinese_month_day', _parse_chinese_month_day, False),
+    ('english', _parse_english, False),
+]
+
+_PARSE_ERRORS = (TypeError, ValueError, IndexError, OverflowError)
+
+
+class DateParser:
+    def __init__(self, formats: List[Tuple[str, Callable[[str], Optional[datetime]], bool]] = DATE_FORMATS):
+        self.formats = formats
+        self._format_cache: Dict[str, Tuple[str, Callable[[str], Optional[datetime]], bool]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def parse(self, date_str: str, source: Optional[str] = None) -> Optional[datetime]:
+        """
+        解析日期字符串，无法解析时返回None
+
+        同一来源的日期格式通常一致，先尝试来源上次命中的格式，命中时只需一次解析。
+        上次命中的是搜索格式时，只有字符串不可能是整串格式（不满足 _EXACT_PREFIX_RE）才先尝试它，
+        否则按优先级顺序尝试，避免把整串格式的字符串按搜索格式截取解析（如丢掉ISO时间的时区）
+        """
+        if not date_str or date_str.isspace():
+            return None
+
+        stats = self._stats.get(source or 'unknown')
+        if stats is None:
+            stats = self._stats[source or 'unknown'] = {'parsed': 0, 'failures': 0}
+
+        cached = self._format_cache.get(source) if source else None
+        if cached is not None and (cached[2] or not _EXACT_PREFIX_RE.match(date_str)):
+            try:
+                dt = cached[1](date_str)
+            except _PARSE_ERRORS:
+                dt = None
+            if dt is not None:
+                stats['parsed'] += 1
+                return dt
+
+        for name, parser, exact in self.formats:
+            try:
+                dt = parser(date_str)
+            except _PARSE_ERRORS:
+                continue
+            if dt is not None:
+                if source:
+                    self._format_cache[source] = (name, parser, exact)
+                stats['parsed'] += 1
+                return dt
+
+        stats['failures'] += 1
+        return None
+
+    def get_format(self, source: str) -> Optional[str]:
+        """获取来源当前记住的日期格式"""
+        cached = self._format_cache.get(source)
+        return cached[0] if cached else None
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """获取各来源的解析成功和失败次数"""
+        return {source: dict(stats) for source, stats in self._stats.items()}
+
+    def get_stats_since(self, snapshot: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+        """
+        获取自 snapshot（之前 get_stats() 的结果）以来各来源的解析次数
+
+        全局实例在常驻调度器中持续累计，按次运行的统计应基于运行开始时的快照计算
+        """
+        result = {}
+        for source, stats in self._stats.items():
+            before = snapshot.get(source, {})
+            delta = {key: value - before.get(key, 0) for key, value in stats.items()}
+            if any(delta.values()):
+                result[source] = delta
+        return result
+
+
+# 全局实例
+date_parser = DateParser()
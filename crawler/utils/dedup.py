@@ -0,0 +1,222 @@
+"""
+新闻去重索引
+每次运行从数据库加载一次，之后的重复判断都在本地完成
+"""
+
+import hashlib
+import random
+import re
+import zlib
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from config.settings import NEAR_DUP_THRESHOLD
+
+_NON_WORD_RE = re.compile(r'[^\w]+')
+_LATIN_TOKEN_RE = re.compile(r'[A-Za-z0-9]+')
+_CHINESE_NUMERAL_RE = re.compile(r'[零一二两三四五六七八九十百千万亿]')
+# 末尾的来源后缀（" - 站点名" 或 " | 站点名"，最多三个词）
+_SITE_SUFFIX_RE = re.compile(r'\s+[-|–—]\s+[^\s\d|–—-]+(?:\s+[^\s\d|–—-]+){0,2}\s*$')
+_PERIOD_WORDS = frozenset([
+    'january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+    'september', 'october', 'november', 'december',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+    'first', 'second', 'third', 'fourth', 'fifth', 'h1', 'h2', 'q1', 'q2', 'q3', 'q4',
+])
+
+
+def generate_news_hash(title: str, url: str = None) -> str:
+    """生成新闻内容哈希值（标题+URL）用于去重"""
+    content = title.lower().strip()
+    if url:
+        content += url.lower().strip()
+    return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+
+class NewsDedupIndex:
+    def __init__(self):
+        self.titles: Dict[str, str] = {}
+        # 标准化标题 -> 原始标题，用于构建近似重复索引（关键词判断区分大小写）
+        self.original_titles: Dict[str, str] = {}
+        self.urls: Dict[str, str] = {}
+        self.content_hashes: Set[str] = set()
+        self.loaded_at: Optional[datetime] = None
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        return ' '.join(title.lower().split())
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        return url.strip().rstrip('/')
+
+    def __len__(self) -> int:
+        return len(self.content_hashes)
+
+    def add(self, news_id: Optional[str], title: str, url: str) -> None:
+        """把一条新闻加入索引"""
+        normalized_title = self.normalize_title(title)
+        if self.titles.get(normalized_title) is None:
+            self.titles[normalized_title] = news_id
+        self.original_titles.setdefault(normalized_title, title)
+        if url:
+            normalized_url = self.normalize_url(url)
+            if self.urls.get(normalized_url) is None:
+                self.urls[normalized_url] = news_id
+        self.content_hashes.add(generate_news_hash(title, url))
+
+    def discard(self, title: str, url: str) -> None:
+        """从索引中移除一条新闻（例如写入失败时）"""
+        normalized_title = self.normalize_title(title)
+        self.titles.pop(normalized_title, None)
+        self.original_titles.pop(normalized_title, None)
+        if url:
+            self.urls.pop(self.normalize_url(url), None)
+        self.content_hashes.discard(generate_news_hash(title, url))
+
+    def get_titles(self) -> List[str]:
+        """返回索引中所有新闻的原始标题"""
+        return list(self.original_titles.values())
+
+    def find_duplicate(self, title: str, url: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        查找重复新闻
+
+        Returns:
+            (重复原因, 已存在新闻的ID)，不重复时返回 (None, None)
+        """
+        normalized_title = self.normalize_title(title)
+        if normalized_title in self.titles:
+            return 'title', self.titles[normalized_title]
+
+        normalized_url = self.normalize_url(url)
+        if normalized_url in self.urls:
+            return 'url', self.urls[normalized_url]
+
+        if generate_news_hash(title, url) in self.content_hashes:
+            return 'hash', None
+
+        return None, None
+
+
+class NearDuplicateTitleIndex:
+    """
+    标题近似重复索引（MinHash + LSH）
+    把标题切成字符n-gram，用MinHash签名分段分桶，查询时只与同桶的候选标题比较。
+
+    短标题中公司名、数字、月份、季度只占很少几个字符，仅靠相似度无法区分
+    "UMC Reports October 2024 Revenue" 和 "TSMC Reports October 2024 Revenue"，
+    因此还会比较两边的关键词（数字、全大写缩写、月份、序数词、中文数字）：
+    双方各有对方没有的关键词时视为不同的新闻
+    """
+
+    _MERSENNE_PRIME = (1 << 31) - 1
+
+    def __init__(self, threshold: float = NEAR_DUP_THRESHOLD, num_perm: int = 128,
+                 bands: Optional[int] = None, shingle_size: int = 3):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands or self.choose_bands(num_perm, threshold)
+        self.rows = num_perm // self.bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(20240101)  # 固定种子，保证结果可复现
+        self._perms = [
+            (rng.randrange(1, self._MERSENNE_PRIME), rng.randrange(0, self._MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+        self._shingles: List[FrozenSet[str]] = []
+        self._key_tokens: List[FrozenSet[str]] = []
+        self._titles: List[str] = []
+
+    @staticmethod
+    def choose_bands(num_perm: int, threshold: float) -> int:
+        """
+        选择LSH分段数，使候选阈值 (1/bands)^(1/rows) 不高于且最接近判定阈值，
+        相似度达到判定阈值的标题对大多会进入同一个桶被比较
+        """
+        candidates = [bands for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+        below = [bands for bands in candidates
+                 if (1 / bands) ** (bands / num_perm) <= threshold]
+        if not below:
+            return num_perm
+        return min(below, key=lambda bands: threshold - (1 / bands) ** (bands / num_perm))
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    @staticmethod
+    def _strip_site_suffix(title: str) -> str:
+        """去掉转载时常见的来源后缀，如 " - EE Times"、" | SemiWiki" """
+        match = _SITE_SUFFIX_RE.search(title)
+        return title[:match.start()] if match and match.start() > 0 else title
+
+    def _shingle(self, title: str) -> FrozenSet[str]:
+        """标准化标题并切分为字符n-gram"""
+        text = _NON_WORD_RE.sub(' ', self._strip_site_suffix(title).lower())
+        text = ' '.join(text.split())
+        if len(text) <= self.shingle_size:
+            return frozenset([text]) if text else frozenset()
+        return frozenset(text[i:i + self.shingle_size] for i in range(len(text) - self.shingle_size + 1))
+
+    def _extract_key_tokens(self, title: str) -> FrozenSet[str]:
+        """提取区分不同新闻的关键词：含数字的词、全大写缩写、月份、序数词和中文数字"""
+        title = self._strip_site_suffix(title)
+        tokens = set()
+        for token in _LATIN_TOKEN_RE.findall(title):
+            lower = token.lower()
+            if any(char.isdigit() for char in token) or (len(token) >= 2 and token.isupper()) \
+                    or lower in _PERIOD_WORDS:
+                tokens.add(lower)
+        tokens.update(_CHINESE_NUMERAL_RE.findall(title))
+        return frozenset(tokens)
+
+    def _signature(self, shingles: FrozenSet[str]) -> List[int]:
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles]
+        prime = self._MERSENNE_PRIME
+        return [min((a * h + b) % prime for h in hashes) for a, b in self._perms]
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            yield band, tuple(signature[band * self.rows:(band + 1) * self.rows])
+
+    def add(self, title: str) -> None:
+        """把标题加入索引"""
+        shingles = self._shingle(title)
+        if not shingles:
+            return
+        position = len(self._titles)
+        self._titles.append(title)
+        self._shingles.append(shingles)
+        self._key_tokens.append(self._extract_key_tokens(title))
+        for band, key in self._band_keys(self._signature(shingles)):
+            self._buckets[band].setdefault(key, []).append(position)
+
+    def find_similar(self, title: str) -> Optional[str]:
+        """返回与给定标题近似重复的已有标题，没有则返回None"""
+        shingles = self._shingle(title)
+        if not shingles:
+            return None
+
+        key_tokens = None
+        checked: Set[int] = set()
+        for band, key in self._band_keys(self._signature(shingles)):
+            for position in self._buckets[band].get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                other = self._shingles[position]
+                similarity = len(shingles & other) / len(shingles | other)
+                if similarity < self.threshold:
+                    continue
+                # 一方的关键词是另一方的子集（如转载时补充了年份）仍视为重复
+                if key_tokens is None:
+                    key_tokens = self._extract_key_tokens(title)
+                other_tokens = self._key_tokens[position]
+                if key_tokens <= other_tokens or other_tokens <= key_tokens:
+                    return self._titles[position]
+        return None
+
+    def is_duplicate(self, title: str) -> bool:
+        return self.find_similar(title) is not None
@@ -0,0 +1,48 @@
+"""
+流式RSS解析
+边下载边解析，每解析完一个条目就交给调用方处理，处理后立即释放，
+大型RSS源的内存占用不随文件大小增长
+"""
+
+import xml.etree.ElementTree as ET
+from typing import AsyncIterable, AsyncIterator, List
+
+# 每次从响应中读取的字节数
+FEED_CHUNK_SIZE = 64 * 1024
+
+
+def _local_name(tag: str) -> str:
+    """去掉命名空间前缀，RSS 1.0 的条目带有命名空间"""
+    return tag.rsplit('}', 1)[-1]
+
+
+async def iter_feed_items(chunks: AsyncIterable[bytes], item_tag: str = 'item') -> AsyncIterator[ET.Element]:
+    """
+    从字节流中逐个解析RSS条目
+
+    条目在交给调用方后会被清空并从父节点移除，调用方不应保留元素引用。
+    XML格式错误时抛出 ET.ParseError，此前已产出的条目不受影响。
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    stack: List[ET.Element] = []
+
+    def drain():
+        for event, elem in parser.read_events():
+            if event == 'start':
+                stack.append(elem)
+                continue
+            stack.pop()
+            if _local_name(elem.tag) == item_tag:
+                yield elem
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+    async for chunk in chunks:
+        parser.feed(chunk)
+        for elem in drain():
+            yield elem
+
+    parser.close()
+    for elem in drain():
+        yield elem
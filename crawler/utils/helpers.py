@@ -1,26 +1,25 @@
 import re
-import jieba
 import hashlib
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from urllib.parse import urljoin, urlparse
 from loguru import logger
-import requests
-from config.settings import WEBSITE_CHECK_TIMEOUT, WEBSITE_CHECK_KEYWORDS, CONTENT_MIN_LENGTH
+from config.settings import WEBSITE_CHECK_TIMEOUT, CONTENT_MIN_LENGTH
+from utils.keyword_matcher import KeywordMatch, keyword_engine
+from utils.date_parser import date_parser
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
 
 def clean_text(text: str) -> str:
     """清理文本内容"""
     if not text:
         return ""
     
-    # 去除HTML标签
-    text = re.sub(r'<[^>]+>', '', text)
-    # 去除多余的空白字符
-    text = re.sub(r'\s+', ' ', text)
-    # 去除首尾空白
-    text = text.strip()
-    
-    return text
+    # 去除HTML标签（不含'<'时跳过）
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
+    # 合并多余的空白字符并去除首尾空白
+    return ' '.join(text.split())
 
 def extract_summary(content: str, max_length: int = 200) -> str:
     """从内容中提取摘要"""
@@ -50,37 +49,20 @@ def extract_summary(content: str, max_length: int = 200) -> str:
     
     return summary
 
-def parse_date(date_str: str) -> Optional[str]:
-    """解析各种格式的日期字符串"""
+def parse_date(date_str: str, source: Optional[str] = None) -> Optional[str]:
+    """
+    解析各种格式的日期字符串
+
+    Args:
+        date_str: 日期字符串
+        source: 来源名称，用于记住该来源的日期格式并统计解析失败次数
+    """
     if not date_str:
         return None
     
-    # 常见的日期格式
-    date_patterns = [
-        r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})',  # 2024-01-01 12:00:00
-        r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2})',           # 2024-01-01 12:00
-        r'(\d{4})-(\d{1,2})-(\d{1,2})',                                  # 2024-01-01
-        r'(\d{4})年(\d{1,2})月(\d{1,2})日',                              # 2024年1月1日
-        r'(\d{1,2})月(\d{1,2})日',                                       # 1月1日
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, date_str)
-        if match:
-            try:
-                groups = match.groups()
-                if len(groups) >= 3:
-                    year = int(groups[0]) if len(groups[0]) == 4 else datetime.now().year
-                    month = int(groups[1] if len(groups) > 2 else groups[0])
-                    day = int(groups[2] if len(groups) > 2 else groups[1])
-                    hour = int(groups[3]) if len(groups) > 3 else 0
-                    minute = int(groups[4]) if len(groups) > 4 else 0
-                    second = int(groups[5]) if len(groups) > 5 else 0
-                    
-                    dt = datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
-                    return dt.isoformat()
-            except (ValueError, IndexError):
-                continue
+    parsed = date_parser.parse(date_str, source)
+    if parsed:
+        return parsed.isoformat()
     
     # 如果解析失败，返回当前时间
     logger.warning(f"Failed to parse date: {date_str}")
@@ -95,7 +77,8 @@ def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
     if not text:
         return []
     
-    # 使用jieba分词
+    # 使用jieba分词（导入和加载词典较慢，首次使用时才导入）
+    import jieba
     words = jieba.lcut(text)
     
     # 过滤停用词和短词
@@ -128,14 +111,8 @@ def is_valid_ic_content(text: str) -> bool:
     if not text or len(text) < CONTENT_MIN_LENGTH:
         return False
     
-    text_lower = text.lower()
-    
     # 检查是否包含IC相关关键词
-    for keyword in WEBSITE_CHECK_KEYWORDS:
-        if keyword.lower() in text_lower:
-            return True
-    
-    return False
+    return keyword_engine.is_relevant(text)
 
 def check_website_availability(url: str) -> Dict[str, Any]:
     """检查网站可用性"""
@@ -146,6 +123,9 @@ def check_website_availability(url: str) -> Dict[str, Any]:
         'response_time': None
     }
     
+    # requests 只有这个同步检查函数使用，调用时才导入
+    import requests
+    
     try:
         start_time = datetime.now()
         response = requests.get(
@@ -178,26 +158,17 @@ def check_website_availability(url: str) -> Dict[str, Any]:
 
 def categorize_news_content(title: str, content: str) -> str:
     """根据新闻标题和内容自动分类"""
-    title_content = (title + ' ' + content).lower()
-    
-    # 定义分类关键词
-    categories = {
-        '制造工艺': ['制造', '工艺', '制程', '7nm', '5nm', '3nm', '晶圆', '代工'],
-        '设计工具': ['eda', '设计', 'cadence', 'synopsys', 'mentor'],
-        '市场分析': ['市场', '预测', '分析', '增长', '营收', '份额', '报告'],
-        '投资并购': ['投资', '并购', '收购', '融资', '上市', '募资', '估值'],
-        '技术创新': ['技术', '创新', '突破', '专利', '研发', '算法', '架构'],
-        '政策法规': ['政策', '法规', '标准', '规范', '监管', '审查', '制裁'],
-        '人事变动': ['人事', '任命', '离职', '加入', 'ceo', 'cto', '高管'],
-        '产品发布': ['发布', '推出', '上市', '产品', '芯片', '处理器']
-    }
-    
-    for category, keywords in categories.items():
-        for keyword in keywords:
-            if keyword in title_content:
-                return category
-    
-    return '行业动态'  # 默认分类
+    return keyword_engine.match(title, content or '').category
+
+def analyze_news_content(title: str, content: str) -> KeywordMatch:
+    """一次扫描标题和内容，得到命中的关键词、分类以及标题和内容、仅标题是否与IC行业相关"""
+    result = keyword_engine.match(title, content or '')
+    if len(f"{title} {content}") < CONTENT_MIN_LENGTH:
+        result = result._replace(is_relevant=False)
+    # 与 is_valid_ic_content(title) 的判断一致
+    if not title or len(title) < CONTENT_MIN_LENGTH:
+        result = result._replace(title_relevant=False)
+    return result
 
 def validate_news_data(news_data: Dict[str, Any]) -> bool:
     """验证新闻数据的完整性"""
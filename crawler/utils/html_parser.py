@@ -0,0 +1,39 @@
+"""
+HTML解析后端
+所有爬虫通过 make_soup 构建 BeautifulSoup，优先使用更快的 lxml，未安装时回退到内置的 html.parser
+"""
+
+from typing import Optional
+
+from bs4 import BeautifulSoup, FeatureNotFound
+from loguru import logger
+
+from config.settings import HTML_PARSER
+
+FALLBACK_PARSER = 'html.parser'
+
+
+def _resolve_parser(name: str) -> str:
+    """检查配置的解析器是否可用，不可用时回退到 html.parser"""
+    if name == FALLBACK_PARSER:
+        return name
+    try:
+        BeautifulSoup('<p></p>', name)
+        return name
+    except FeatureNotFound:
+        logger.warning(f"HTML parser '{name}' is not available, falling back to {FALLBACK_PARSER}")
+        return FALLBACK_PARSER
+
+
+PARSER_BACKEND = _resolve_parser(HTML_PARSER)
+
+
+def make_soup(markup, parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    使用配置的解析后端构建 BeautifulSoup
+
+    Args:
+        markup: HTML文本或字节
+        parser: 指定解析器（主要用于基准测试），默认使用配置的后端
+    """
+    return BeautifulSoup(markup, parser or PARSER_BACKEND)
@@ -0,0 +1,64 @@
+"""
+共享HTTP连接池
+新闻、IC技术圈和网站检查爬虫共用同一个 aiohttp 会话，
+复用 keep-alive 连接和 DNS 缓存，避免每次请求重新握手
+"""
+
+import asyncio
+from typing import Optional
+
+import aiohttp
+from loguru import logger
+
+from config.settings import (
+    USER_AGENT, DOWNLOAD_TIMEOUT, HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST, DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT
+)
+
+
+class HttpClient:
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refcount = 0
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """创建带连接池的会话（默认校验证书，需要时在单个请求上传入 ssl=False）"""
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_POOL_LIMIT,
+            limit_per_host=HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT),
+            headers={'User-Agent': USER_AGENT}
+        )
+
+    async def acquire(self) -> aiohttp.ClientSession:
+        """获取共享会话，使用完毕后需调用 release()"""
+        loop = asyncio.get_running_loop()
+
+        # 会话绑定在创建它的事件循环上，循环变化后需要重新创建
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = self._create_session()
+            self._loop = loop
+            self._refcount = 0
+            logger.debug("Created shared HTTP session")
+
+        self._refcount += 1
+        return self._session
+
+    async def release(self) -> None:
+        """释放共享会话，最后一个使用者释放时关闭连接池"""
+        self._refcount = max(self._refcount - 1, 0)
+        if self._refcount == 0 and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._loop = None
+            logger.debug("Closed shared HTTP session")
+
+
+# 全局实例
+http_client = HttpClient()
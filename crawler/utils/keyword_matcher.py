@@ -0,0 +1,115 @@
+"""
+关键词匹配引擎
+IC相关性关键词和新闻分类关键词在导入时编译为一个组合正则，
+一次扫描即可得到文本命中的全部关键词，再据此判断相关性并按权重选出分类
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from config.settings import (
+    WEBSITE_CHECK_KEYWORDS, NEWS_CATEGORIES, NEWS_DEFAULT_CATEGORY,
+    NEWS_CATEGORY_KEYWORD_WEIGHTS, NEWS_CATEGORY_TITLE_WEIGHT
+)
+
+
+class KeywordMatcher:
+    """多关键词匹配器（大小写不敏感的子串匹配）"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = sorted({keyword.lower() for keyword in keywords if keyword}, key=lambda k: (-len(k), k))
+        alternation = '|'.join(re.escape(keyword) for keyword in self.keywords)
+        # 零宽前瞻使每个位置都能匹配，重叠的关键词也不会漏掉
+        self._scan_re = re.compile(f'(?=({alternation}))') if self.keywords else None
+        self._search_re = re.compile(alternation) if self.keywords else None
+        # 同一位置只会匹配到最长的关键词，预先记录每个关键词以其为前缀的较短关键词
+        self._prefixes: Dict[str, List[str]] = {
+            keyword: [other for other in self.keywords if other != keyword and keyword.startswith(other)]
+            for keyword in self.keywords
+        }
+
+    def scan(self, text: str) -> Counter:
+        """返回文本中每个关键词的命中次数"""
+        counts = Counter()
+        if not text or self._scan_re is None:
+            return counts
+        for match in self._scan_re.finditer(text.lower()):
+            keyword = match.group(1)
+            counts[keyword] += 1
+            for prefix in self._prefixes[keyword]:
+                counts[prefix] += 1
+        return counts
+
+    def contains_any(self, text: str) -> bool:
+        """文本是否包含任一关键词，找到第一个即返回"""
+        if not text or self._search_re is None:
+            return False
+        return self._search_re.search(text.lower()) is not None
+
+
+class KeywordMatch(NamedTuple):
+    keywords: Dict[str, int]
+    category: str
+    is_relevant: bool
+    # 仅标题是否与IC行业相关（列表页条目只有标题可用于判断相关性）
+    title_relevant: bool
+
+
+class NewsKeywordEngine:
+    """新闻关键词引擎：一次扫描同时完成IC相关性判断和分类"""
+
+    def __init__(self, relevance_keywords: Iterable[str] = WEBSITE_CHECK_KEYWORDS,
+                 categories: Dict[str, List[str]] = NEWS_CATEGORIES,
+                 keyword_weights: Optional[Dict[str, float]] = None,
+                 title_weight: float = NEWS_CATEGORY_TITLE_WEIGHT,
+                 default_category: str = NEWS_DEFAULT_CATEGORY):
+        if keyword_weights is None:
+            keyword_weights = NEWS_CATEGORY_KEYWORD_WEIGHTS
+        self.relevance_keywords = frozenset(keyword.lower() for keyword in relevance_keywords)
+        self.categories = list(categories)
+        self.default_category = default_category
+        self.title_weight = title_weight
+
+        # 关键词 -> [(分类序号, 权重)]，同一关键词可以属于多个分类
+        self._category_keywords: Dict[str, List[tuple]] = {}
+        for index, (category, keywords) in enumerate(categories.items()):
+            for keyword in keywords:
+                weight = keyword_weights.get(keyword, 1.0)
+                self._category_keywords.setdefault(keyword.lower(), []).append((index, weight))
+
+        self.matcher = KeywordMatcher(list(self.relevance_keywords) + list(self._category_keywords))
+        self.relevance_matcher = KeywordMatcher(self.relevance_keywords)
+
+    def is_relevant(self, text: str) -> bool:
+        """文本是否与IC行业相关"""
+        return self.relevance_matcher.contains_any(text)
+
+    def categorize(self, title_counts: Counter, content_counts: Counter) -> str:
+        """按加权得分选择分类，得分相同时取表中靠前的分类"""
+        scores = [0.0] * len(self.categories)
+        for counts, multiplier in ((title_counts, self.title_weight), (content_counts, 1.0)):
+            for keyword, count in counts.items():
+                for index, weight in self._category_keywords.get(keyword, ()):
+                    scores[index] += count * weight * multiplier
+
+        best_index = max(range(len(scores)), key=lambda i: (scores[i], -i), default=None)
+        if best_index is None or scores[best_index] <= 0:
+            return self.default_category
+        return self.categories[best_index]
+
+    def match(self, title: str, content: str = '') -> KeywordMatch:
+        """扫描标题和内容，返回命中的关键词、分类和相关性"""
+        title_counts = self.matcher.scan(title)
+        content_counts = self.matcher.scan(content)
+        keywords = title_counts + content_counts
+        return KeywordMatch(
+            keywords=dict(keywords),
+            category=self.categorize(title_counts, content_counts),
+            is_relevant=any(keyword in self.relevance_keywords for keyword in keywords),
+            title_relevant=any(keyword in self.relevance_keywords for keyword in title_counts),
+        )
+
+
+# 全局实例，导入时编译一次
+keyword_engine = NewsKeywordEngine()
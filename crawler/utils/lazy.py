@@ -0,0 +1,36 @@
+"""
+延迟初始化
+全局实例在首次使用时才创建，导入模块不会建立数据库连接或加载模型
+"""
+
+from typing import Any, Callable
+
+
+class LazyProxy:
+    """代理对象：首次访问属性时调用工厂函数创建实际对象，之后所有访问都转发给它"""
+
+    def __init__(self, factory: Callable[[], Any]):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+
+    def _get_instance(self) -> Any:
+        instance = object.__getattribute__(self, '_instance')
+        if instance is None:
+            instance = object.__getattribute__(self, '_factory')()
+            object.__setattr__(self, '_instance', instance)
+        return instance
+
+    @property
+    def is_initialized(self) -> bool:
+        return object.__getattribute__(self, '_instance') is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._get_instance(), name, value)
+
+    def __repr__(self) -> str:
+        if not self.is_initialized:
+            return f"<LazyProxy (not initialized) for {object.__getattribute__(self, '_factory')!r}>"
+        return repr(self._get_instance())
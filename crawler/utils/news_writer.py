@@ -0,0 +1,132 @@
+"""
+新闻批量写入器
+缓冲待写入的新闻，按数量或时间间隔以多行 upsert 写入数据库，
+并把每一行的写入结果（新闻ID）返回给对应的调用方
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from config.settings import NEWS_WRITE_BATCH_SIZE, NEWS_WRITE_FLUSH_INTERVAL
+
+
+class NewsWriteError(Exception):
+    """批量写入请求失败（与因 original_url 冲突被忽略的重复新闻区分）"""
+
+
+class NewsWriter:
+    def __init__(self, client, batch_size: int = NEWS_WRITE_BATCH_SIZE,
+                 flush_interval: float = NEWS_WRITE_FLUSH_INTERVAL):
+        self.client = client
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.request_count = 0
+        self.written_count = 0
+
+        self._buffer: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """缓冲区绑定在当前事件循环上，循环变化时丢弃上一个循环遗留的状态"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._buffer = []
+            self._timer = None
+            self._tasks = set()
+            self._loop = loop
+        return loop
+
+    def enqueue(self, row: Dict[str, Any]) -> asyncio.Future:
+        """
+        把一行新闻加入缓冲区并立即返回，不等待写入
+
+        Returns:
+            写入完成后得到新闻ID的Future，因 original_url 冲突被忽略时结果为None，
+            所在批次写入失败时抛出 NewsWriteError
+        """
+        loop = self._bind_loop()
+        future = loop.create_future()
+        self._buffer.append((row, future))
+
+        if len(self._buffer) >= self.batch_size:
+            self._flush_soon()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_soon)
+
+        return future
+
+    async def submit(self, row: Dict[str, Any]) -> Optional[str]:
+        """
+        提交一行新闻并等待写入完成，返回新闻ID，因 original_url 冲突被忽略时返回None
+
+        Raises:
+            NewsWriteError: 所在批次的写入请求失败
+        """
+        return await self.enqueue(row)
+
+    def _take_batch(self) -> List[Tuple[Dict[str, Any], asyncio.Future]]:
+        """取出当前缓冲区并取消定时写入"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _flush_soon(self) -> None:
+        """在后台写入当前缓冲区"""
+        batch = self._take_batch()
+        if not batch:
+            return
+        task = self._loop.create_task(self._write_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """立即写入缓冲区中的所有新闻"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        batch = self._take_batch()
+        if batch:
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """以多行 upsert 写入一个批次，并把结果分发给各调用方"""
+        # PostgREST 多行写入要求每行字段一致，按字段集合分组
+        groups: Dict[Tuple[str, ...], List[Tuple[Dict[str, Any], asyncio.Future]]] = {}
+        for row, future in batch:
+            groups.setdefault(tuple(sorted(row)), []).append((row, future))
+
+        for group in groups.values():
+            rows = [row for row, _ in group]
+            try:
+                self.request_count += 1
+                # 以 original_url 为冲突键，已存在的新闻保持不变；
+                # Supabase客户端是同步的，请求放到线程中执行，避免阻塞事件循环
+                result = await asyncio.to_thread(
+                    self.client.table('news').upsert(
+                        rows, on_conflict='original_url', ignore_duplicates=True
+                    ).execute
+                )
+                saved_ids = {item['original_url']: item['id'] for item in result.data or []}
+                self.written_count += len(saved_ids)
+                logger.info(f"Upserted {len(saved_ids)}/{len(rows)} news rows in one request")
+            except Exception as e:
+                logger.error(f"Error upserting {len(rows)} news rows: {e}")
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(NewsWriteError(str(e)))
+                continue
+
+            for row, future in group:
+                if not future.done():
+                    future.set_result(saved_ids.get(row['original_url']))
+
+    async def close(self) -> None:
+        """写入剩余数据并等待后台写入完成"""
+        await self.flush()
+        if self._tasks and self._loop is asyncio.get_running_loop():
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
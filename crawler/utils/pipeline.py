@@ -0,0 +1,105 @@
+"""
+分阶段流水线
+各阶段之间用有界队列连接，每个阶段由若干并发worker处理；
+下游处理不过来时队列写满，上游随之暂停（背压），条目逐个向下游流动而不是整批等待
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+from loguru import logger
+
+# 队列结束标记，每个worker收到一个后退出
+_DONE = object()
+
+
+class Stage(NamedTuple):
+    name: str
+    func: Callable[[Any], Awaitable[Optional[Any]]]   # 返回None表示丢弃该条目
+    workers: int = 1
+
+
+class Pipeline:
+    def __init__(self, stages: List[Stage], queue_size: int,
+                 on_finished: Optional[Callable[[Any], None]] = None):
+        """
+        Args:
+            stages: 按顺序排列的处理阶段
+            queue_size: 阶段之间队列的最大长度
+            on_finished: 条目处理完成（被某个阶段丢弃或通过最后一个阶段）时以 source 产出的原始条目调用，
+                处理出错的条目不会调用
+        """
+        if not stages:
+            raise ValueError("Pipeline requires at least one stage")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.on_finished = on_finished
+        # 每个阶段的统计：passed（交给下游）、dropped（被过滤）、errors（处理异常）
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    async def run(self, source: AsyncIterator[Any]) -> Dict[str, Dict[str, int]]:
+        """从 source 读取条目送入流水线，等待全部处理完成后返回各阶段统计"""
+        self.stats = {stage.name: {'passed': 0, 'dropped': 0, 'errors': 0} for stage in self.stages}
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+
+        def finish(origin: Any) -> None:
+            if self.on_finished is not None:
+                self.on_finished(origin)
+
+        async def feed() -> None:
+            try:
+                async for item in source:
+                    # 队列中传递 (原始条目, 当前阶段的输入)，便于在处理完成时回调原始条目
+                    await queues[0].put((item, item))
+            finally:
+                for _ in range(self.stages[0].workers):
+                    await queues[0].put(_DONE)
+
+        async def work(index: int) -> None:
+            stage = self.stages[index]
+            stats = self.stats[stage.name]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            while True:
+                entry = await inbox.get()
+                if entry is _DONE:
+                    return
+                origin, item = entry
+                try:
+                    result = await stage.func(item)
+                except Exception as e:
+                    stats['errors'] += 1
+                    logger.warning(f"Pipeline stage {stage.name} failed: {e}")
+                    continue
+                if result is None:
+                    stats['dropped'] += 1
+                    finish(origin)
+                    continue
+                stats['passed'] += 1
+                if outbox is not None:
+                    await outbox.put((origin, result))
+                else:
+                    finish(origin)
+
+        async def run_stage(index: int) -> None:
+            try:
+                await asyncio.gather(*(work(index) for _ in range(self.stages[index].workers)))
+            finally:
+                # 本阶段所有worker退出后通知下游结束
+                if index + 1 < len(self.stages):
+                    for _ in range(self.stages[index + 1].workers):
+                        await queues[index + 1].put(_DONE)
+
+        tasks = [asyncio.create_task(run_stage(index)) for index in range(len(self.stages))]
+        try:
+            # source 出错时已经送入流水线的条目仍然处理完，再向外抛出异常
+            try:
+                await feed()
+            except Exception:
+                await asyncio.gather(*tasks)
+                raise
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return self.stats
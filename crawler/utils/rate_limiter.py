@@ -0,0 +1,38 @@
+"""
+按主机的请求节流
+同一主机的两次请求之间至少间隔 CRAWL_DELAY 秒，不同主机之间互不影响
+"""
+
+import asyncio
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+from config.settings import CRAWL_DELAY
+
+
+class HostRateLimiter:
+    def __init__(self, delay: float = CRAWL_DELAY):
+        self.delay = delay
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._last_request: Dict[str, float] = {}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    async def wait(self, url: str) -> None:
+        """等待直到可以向该URL所在主机发起下一次请求"""
+        if self.delay <= 0:
+            return
+
+        host = self._host(url)
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            last = self._last_request.get(host)
+            if last is not None:
+                remaining = self.delay - (time.monotonic() - last)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
+            self._last_request[host] = time.monotonic()
@@ -0,0 +1,58 @@
+"""
+本地JSON状态存储
+用于保存跨运行的小型爬虫状态（HTTP缓存校验值、增量爬取位置等）
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+
+class JsonStateStore:
+    def __init__(self, path: str):
+        self.path = path
+        self._data: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._data = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Failed to load state from {self.path}: {e}")
+        return self._data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._load().get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._load()[key] = value
+        self._dirty = True
+
+    def delete(self, key: str) -> None:
+        if self._load().pop(key, None) is not None:
+            self._dirty = True
+
+    def items(self):
+        return self._load().items()
+
+    def save(self) -> None:
+        """写回文件（先写临时文件再替换，避免中途中断导致文件损坏）"""
+        if not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.error(f"Failed to save state to {self.path}: {e}")
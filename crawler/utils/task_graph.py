@@ -0,0 +1,101 @@
+"""
+按依赖关系并发运行的任务图
+每个阶段在其依赖全部完成后立即开始，互不依赖的阶段并发运行；
+运行结束后可以得到各阶段耗时和关键路径
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+
+class StageTiming(NamedTuple):
+    started: float      # 相对任务图开始的秒数
+    duration: float
+    status: str         # success / error / skipped
+
+
+class TaskGraph:
+    def __init__(self):
+        self._stages: Dict[str, Tuple[Callable[[], Awaitable[Any]], Tuple[str, ...]]] = {}
+        self.results: Dict[str, Any] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self.timings: Dict[str, StageTiming] = {}
+
+    def add(self, name: str, func: Callable[[], Awaitable[Any]], depends_on: Iterable[str] = ()) -> None:
+        """添加阶段，依赖的阶段必须先添加（保证没有环）"""
+        depends_on = tuple(depends_on)
+        for dependency in depends_on:
+            if dependency not in self._stages:
+                raise ValueError(f"Stage '{name}' depends on unknown stage '{dependency}'")
+        self._stages[name] = (func, depends_on)
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        运行所有阶段并返回各阶段结果
+
+        某个阶段失败时，依赖它的阶段被跳过，其他阶段照常运行；
+        全部结束后抛出第一个失败阶段的异常
+        """
+        self.results, self.errors, self.timings = {}, {}, {}
+        start = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_stage(name: str) -> Any:
+            func, depends_on = self._stages[name]
+            if depends_on:
+                await asyncio.gather(*(tasks[dependency] for dependency in depends_on), return_exceptions=True)
+            stage_start = time.perf_counter()
+            failed = [dependency for dependency in depends_on if dependency not in self.results]
+            if failed:
+                logger.warning(f"Skipping stage {name}: dependency {', '.join(failed)} did not complete")
+                self.timings[name] = StageTiming(stage_start - start, 0.0, 'skipped')
+                return None
+
+            logger.info(f"Stage {name} started")
+            try:
+                self.results[name] = await func()
+                status = 'success'
+            except Exception as e:
+                self.errors[name] = e
+                status = 'error'
+                logger.error(f"Stage {name} failed: {e}")
+            self.timings[name] = StageTiming(stage_start - start, time.perf_counter() - stage_start, status)
+            return self.results.get(name)
+
+        # 阶段按添加顺序排列，依赖总在前面，创建Task时依赖的Task已经存在
+        for name in self._stages:
+            tasks[name] = asyncio.create_task(run_stage(name), name=name)
+        await asyncio.gather(*tasks.values())
+
+        if self.errors:
+            raise next(iter(self.errors.values()))
+        return self.results
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        按实际耗时计算关键路径（决定总耗时的最长依赖链）
+
+        Returns:
+            (关键路径上的阶段, 关键路径总耗时秒数)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for name, (_, depends_on) in self._stages.items():
+            if name not in self.timings:
+                continue
+            slowest = max(depends_on, key=lambda dependency: finish.get(dependency, 0.0), default=None)
+            finish[name] = finish.get(slowest, 0.0) + self.timings[name].duration
+            previous[name] = slowest
+
+        if not finish:
+            return [], 0.0
+        name = max(finish, key=finish.get)
+        length = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+        return path[::-1], length
@@ -0,0 +1,105 @@
+"""
+翻译结果持久化缓存
+以 sha256(目标语言 + 原文) 为键存储在SQLite中，超过容量时按最近使用时间淘汰
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from loguru import logger
+
+from config.settings import TRANSLATION_CACHE_PATH, TRANSLATION_CACHE_MAX_ENTRIES
+
+
+class TranslationCache:
+    def __init__(self, path: str = TRANSLATION_CACHE_PATH, max_entries: int = TRANSLATION_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count = 0
+
+    @staticmethod
+    def make_key(text: str, target_lang: str) -> str:
+        """生成缓存键"""
+        return hashlib.sha256(f"{target_lang.upper()}\0{text}".encode('utf-8')).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                ' key TEXT PRIMARY KEY,'
+                ' translated TEXT NOT NULL,'
+                ' last_used REAL NOT NULL)'
+            )
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_translations_last_used ON translations(last_used)')
+            self._count = self._conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+            logger.debug(f"Translation cache opened: {self.path} ({self._count} entries)")
+        return self._conn
+
+    def get(self, text: str, target_lang: str) -> Optional[str]:
+        """读取缓存，命中时刷新最近使用时间"""
+        try:
+            conn = self._connect()
+            key = self.make_key(text, target_lang)
+            row = conn.execute('SELECT translated FROM translations WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute('UPDATE translations SET last_used = ? WHERE key = ?', (time.time(), key))
+            conn.commit()
+            self.hits += 1
+            return row[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache read failed: {e}")
+            self.misses += 1
+            return None
+
+    def set(self, text: str, target_lang: str, translated: str) -> None:
+        """写入缓存，超过容量时淘汰最久未使用的条目"""
+        try:
+            conn = self._connect()
+            cursor = conn.execute(
+                'INSERT OR REPLACE INTO translations (key, translated, last_used) VALUES (?, ?, ?)',
+                (self.make_key(text, target_lang), translated, time.time())
+            )
+            self._count += cursor.rowcount
+            if self._count > self.max_entries:
+                self._evict()
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Translation cache write failed: {e}")
+
+    def _evict(self) -> None:
+        """淘汰最久未使用的条目，一次多删除10%以减少淘汰频率"""
+        target = int(self.max_entries * 0.9)
+        conn = self._connect()
+        conn.execute(
+            'DELETE FROM translations WHERE key IN ('
+            ' SELECT key FROM translations ORDER BY last_used ASC LIMIT ?)',
+            (max(self._count - target, 0),)
+        )
+        self._count = conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取缓存命中统计"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': self._count,
+            'max_entries': self.max_entries
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,44 +1,216 @@
 import os
+import asyncio
 import httpx
+from typing import Dict, List, Optional, Set, Tuple
 from loguru import logger
 
+from utils.translation_cache import TranslationCache
+from utils.lazy import LazyProxy
+
 DEEPL_API_KEY = os.getenv('DEEPL_API_KEY')
 DEEPL_API_URL = "https://api-free.deepl.com/v2/translate"
 
-async def translate_text(text: str, target_lang: str = "ZH") -> str:
-    """使用DeepL API翻译文本"""
-    if not DEEPL_API_KEY:
-        logger.warning("DeepL API Key not found. Skipping translation.")
-        return text
+# DeepL单次请求最多50条文本，请求体不超过128KiB
+DEEPL_MAX_BATCH_TEXTS = 50
+DEEPL_MAX_BATCH_BYTES = 120 * 1024
+# 等待更多文本加入同一批次的时间（秒）
+DEEPL_BATCH_LINGER = 0.05
 
-    if not text or not text.strip():
-        return ""
 
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                DEEPL_API_URL,
+class BatchTranslator:
+    """批量翻译器：收集待翻译文本，按批次调用DeepL，相同文本的并发请求只翻译一次"""
+
+    def __init__(self, cache: Optional[TranslationCache] = None,
+                 max_batch_texts: int = DEEPL_MAX_BATCH_TEXTS,
+                 max_batch_bytes: int = DEEPL_MAX_BATCH_BYTES,
+                 linger: float = DEEPL_BATCH_LINGER):
+        self.cache = cache
+        self.max_batch_texts = max_batch_texts
+        self.max_batch_bytes = max_batch_bytes
+        self.linger = linger
+        self.request_count = 0
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_bytes: Dict[str, int] = {}
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._refcount = 0
+        self._warned_missing_key = False
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        """客户端和待处理队列绑定在当前事件循环上，循环变化时重置"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._client = None
+            self._pending.clear()
+            self._pending_bytes.clear()
+            self._inflight.clear()
+            self._timers.clear()
+            self._tasks.clear()
+            self._refcount = 0
+            self._loop = loop
+        return loop
+
+    def acquire(self) -> None:
+        """登记一个使用者，使用完毕后需调用 release()；常驻调度器持有期间HTTP客户端在各次运行之间复用"""
+        self._bind_loop()
+        self._refcount += 1
+
+    async def release(self) -> None:
+        """释放使用者并发送剩余批次，最后一个使用者释放时关闭HTTP客户端"""
+        self._refcount = max(self._refcount - 1, 0)
+        if self._refcount == 0:
+            await self.aclose()
+        else:
+            await self.flush()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
                 headers={
                     "Authorization": f"DeepL-Auth-Key {DEEPL_API_KEY}",
                     "Content-Type": "application/json",
                 },
-                json={
-                    "text": [text],
-                    "target_lang": target_lang.upper(),
-                },
                 timeout=30.0
             )
+        return self._client
+
+    async def translate(self, text: str, target_lang: str = "ZH") -> str:
+        """翻译单条文本，实际请求会与其他并发调用合并"""
+        if not text or not text.strip():
+            return ""
+
+        target_lang = target_lang.upper()
+
+        # 优先使用持久化缓存，已翻译过的内容不再请求DeepL
+        if self.cache is not None:
+            cached = self.cache.get(text, target_lang)
+            if cached is not None:
+                return cached
+
+        if not DEEPL_API_KEY:
+            if not self._warned_missing_key:
+                logger.warning("DeepL API Key not found. Skipping translation.")
+                self._warned_missing_key = True
+            return text
+
+        loop = self._bind_loop()
+        key = (target_lang, text)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._inflight[key] = future
+            self._enqueue(target_lang, text)
+
+        # shield: 某个调用方被取消时不影响共享同一结果的其他调用方
+        return await asyncio.shield(future)
+
+    def _enqueue(self, target_lang: str, text: str) -> None:
+        """加入待翻译批次，达到上限时立即发送"""
+        size = len(text.encode('utf-8'))
+        pending = self._pending.get(target_lang)
+
+        if pending and self._pending_bytes[target_lang] + size > self.max_batch_bytes:
+            self._flush_soon(target_lang)
+            pending = None
+
+        if not pending:
+            pending = self._pending[target_lang] = []
+            self._pending_bytes[target_lang] = 0
+
+        pending.append(text)
+        self._pending_bytes[target_lang] += size
+
+        if len(pending) >= self.max_batch_texts:
+            self._flush_soon(target_lang)
+        elif target_lang not in self._timers:
+            self._timers[target_lang] = self._loop.call_later(
+                self.linger, self._flush_soon, target_lang
+            )
+
+    def _flush_soon(self, target_lang: str) -> None:
+        """取出当前批次并在后台发送"""
+        timer = self._timers.pop(target_lang, None)
+        if timer:
+            timer.cancel()
+
+        batch = self._pending.pop(target_lang, None)
+        self._pending_bytes.pop(target_lang, None)
+        if not batch:
+            return
+
+        task = self._loop.create_task(self._send_batch(target_lang, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, target_lang: str, batch: List[str]) -> None:
+        """发送一个批次并把结果分发给各调用方"""
+        translations = batch
+        try:
+            self.request_count += 1
+            response = await self._get_client().post(
+                DEEPL_API_URL,
+                json={
+                    "text": batch,
+                    "target_lang": target_lang,
+                }
+            )
             response.raise_for_status()  # Raises HTTPStatusError for bad responses (4xx or 5xx)
             data = response.json()
-            translated_text = data['translations'][0]['text']
-            logger.info(f"Successfully translated text to {target_lang}")
-            return translated_text
-    except httpx.HTTPStatusError as e:
-        logger.error(f"DeepL API returned an error: {e.response.status_code} - {e.response.text}")
-        return text
-    except httpx.RequestError as e:
-        logger.error(f"An error occurred while requesting DeepL API: {e}")
-        return text
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during translation: {e}")
-        return text
+            translations = [item['text'] for item in data['translations']]
+            logger.info(f"Successfully translated {len(batch)} texts to {target_lang}")
+            if self.cache is not None and len(translations) == len(batch):
+                for text, translated in zip(batch, translations):
+                    self.cache.set(text, target_lang, translated)
+        except httpx.HTTPStatusError as e:
+            logger.error(f"DeepL API returned an error: {e.response.status_code} - {e.response.text}")
+        except httpx.RequestError as e:
+            logger.error(f"An error occurred while requesting DeepL API: {e}")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred during translation: {e}")
+        finally:
+            # 翻译失败时返回原文，与单条翻译的行为保持一致
+            if len(translations) != len(batch):
+                translations = batch
+            for text, translated in zip(batch, translations):
+                future = self._inflight.pop((target_lang, text), None)
+                if future is not None and not future.done():
+                    future.set_result(translated)
+
+    async def flush(self) -> None:
+        """立即发送所有待翻译批次并等待完成"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for target_lang in list(self._pending):
+            self._flush_soon(target_lang)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        """获取翻译请求和缓存命中统计"""
+        stats = {'requests': self.request_count}
+        if self.cache is not None:
+            stats.update(self.cache.get_stats())
+        return stats
+
+    async def aclose(self) -> None:
+        """发送剩余批次并关闭HTTP客户端"""
+        await self.flush()
+        if self.cache is not None:
+            stats = self.cache.get_stats()
+            logger.info(f"Translation cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries")
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+
+
+# 全局实例
+translator = LazyProxy(lambda: BatchTranslator(cache=TranslationCache()))
+
+async def translate_text(text: str, target_lang: str = "ZH") -> str:
+    """使用DeepL API翻译文本"""
+    return await translator.translate(text, target_lang)
@@ -0,0 +1,53 @@
+"""
+新闻源增量爬取位置（高水位线）
+记录每个源已处理过的最新发布时间和最近的条目GUID，
+再次爬取时在任何耗时处理之前跳过已处理的条目
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 保留的最近GUID数量，应大于单个RSS源一次返回的条目数
+MAX_WATERMARK_GUIDS = 500
+
+
+class SourceWatermark:
+    def __init__(self, published_at: Optional[datetime] = None, guids: Optional[List[str]] = None):
+        self.published_at = published_at
+        self.guids: List[str] = list(guids or [])
+        self._guid_set = set(self.guids)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'SourceWatermark':
+        if not data:
+            return cls()
+        published_at = None
+        if data.get('published_at'):
+            published_at = datetime.fromisoformat(data['published_at'])
+        return cls(published_at, data.get('guids'))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'published_at': self.published_at.isoformat() if self.published_at else None,
+            'guids': self.guids[-MAX_WATERMARK_GUIDS:],
+        }
+
+    def is_processed(self, guid: Optional[str], published_at: Optional[datetime]) -> bool:
+        """
+        判断条目是否已在之前的运行中处理过
+
+        发布时间早于水位线的条目直接跳过；与水位线时间相同或没有时间的条目按GUID判断
+        """
+        if guid and guid in self._guid_set:
+            return True
+        if published_at and self.published_at:
+            return published_at < self.published_at
+        return False
+
+    def advance(self, guid: Optional[str], published_at: Optional[datetime]) -> None:
+        """把条目记入水位线，只应在条目处理完成（已保存、判为重复或被过滤）后调用"""
+        if guid and guid not in self._guid_set:
+            self.guids.append(guid)
+            self._guid_set.add(guid)
+        if published_at and (self.published_at is None or published_at > self.published_at):
+            self.published_at = published_at
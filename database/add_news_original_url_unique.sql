@@ -0,0 +1,11 @@
+-- 为news表的original_url添加唯一索引
+-- 爬虫批量写入新闻时使用 upsert(on_conflict='original_url')，依赖该唯一约束
+
+-- 先删除URL重复的新闻，保留最早创建的一条
+DELETE FROM news a
+USING news b
+WHERE a.original_url = b.original_url
+  AND (a.created_at > b.created_at OR (a.created_at = b.created_at AND a.id > b.id));
+
+-- 创建唯一索引
+CREATE UNIQUE INDEX IF NOT EXISTS idx_news_original_url_unique ON news(original_url);
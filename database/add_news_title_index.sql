@@ -0,0 +1,4 @@
+-- 为news表的title添加索引
+-- 爬虫的本地去重索引只加载最近几天的新闻，更早的同标题新闻按 title 精确查询，依赖该索引
+
+CREATE INDEX IF NOT EXISTS idx_news_title ON news(title);
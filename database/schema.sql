@@ -63,7 +63,7 @@ CREATE TABLE news (
   translated_content TEXT, -- 翻译后的完整内容
   source VARCHAR(100) NOT NULL,
   author VARCHAR(100),
-  original_url VARCHAR(500) NOT NULL,
+  original_url VARCHAR(500) NOT NULL UNIQUE, -- 爬虫按 original_url 批量 upsert，依赖该唯一约束
   image_url VARCHAR(500), -- 配图URL
   category VARCHAR(50), -- 新闻分类
   tags TEXT[],
@@ -104,6 +104,7 @@ CREATE INDEX idx_websites_active ON websites(is_active);
 CREATE INDEX idx_websites_tags ON websites USING GIN(tags);
 CREATE INDEX idx_news_published ON news(published_at DESC);
 CREATE INDEX idx_news_source ON news(source);
+CREATE INDEX idx_news_title ON news(title);
 CREATE INDEX idx_news_tags ON news USING GIN(tags);
 CREATE INDEX idx_wechat_active ON wechat_accounts(is_active);
 CREATE INDEX idx_visit_stats_resource ON visit_stats(resource_type, resource_id);
@@ -17,7 +17,7 @@ source venv/bin/activate
 
 python3 -c "
 try:
-    import requests, beautifulsoup4, supabase, schedule, loguru
+    import requests, beautifulsoup4, supabase, aiohttp, loguru
     print('✅ Python依赖正常')
 except ImportError as e:
     print(f'❌ Python依赖错误: {e}')
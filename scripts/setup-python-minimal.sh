@@ -30,7 +30,6 @@ pip install beautifulsoup4==4.12.2
 pip install feedparser==6.0.10
 pip install python-dotenv==1.0.0
 pip install supabase==2.3.0
-pip install schedule==1.2.0
 pip install fake-useragent==1.4.0
 pip install jieba==0.42.1
 pip install loguru==0.7.2
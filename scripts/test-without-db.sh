@@ -32,12 +32,6 @@ try:
 except ImportError as e:
     print(f'❌ beautifulsoup4: {e}')
 
-try:
-    import schedule
-    print('✅ schedule')
-except ImportError as e:
-    print(f'❌ schedule: {e}')
-
 try:
     from loguru import logger
     print('✅ loguru')